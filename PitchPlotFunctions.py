@@ -3,8 +3,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from PIL import Image
-import requests
 from io import BytesIO
+from datetime import date
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 from matplotlib.ticker import FuncFormatter
 import matplotlib.transforms as transforms
@@ -12,14 +12,279 @@ from matplotlib.patches import Ellipse
 import matplotlib.gridspec as gridspec
 import matplotlib.patches as mpatches
 import matplotlib.lines as mlines
+import matplotlib.colors as mcolors
+from matplotlib import font_manager
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import streamlit as st
+import os
+import time
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 import api_scraper
 
 # Initialize the scraper
 scraper = api_scraper.MLB_Scrape()
 
+# Render quality tiers of the 16x16in plot and the dpi each one is drawn and encoded at
+RENDER_QUALITY = {'preview': 50, 'screen': 200, 'print': 400}
+
+# Format an axis tick as a whole number, a module-level function so figure templates can be pickled
+def int_tick(x, pos):
+    return int(x)
+
+# The footer font, or the default sans-serif where Calibri is not installed. Looking up a missing font re-raises one cached
+# error whose traceback grows with every draw and keeps each drawn figure alive
+FOOTER_FONT = 'Calibri' if 'Calibri' in {font.name for font in font_manager.fontManager.ttflist} else 'sans-serif'
+
+class ImageCache:
+    def __init__(self, scraper: api_scraper.MLB_Scrape = scraper, path: str = 'image_cache', ttl: int = 7 * 24 * 3600, max_items: int = 64):
+        """
+        Two-tier cache of remote images: decoded arrays in an in-memory LRU, and the original bytes on disk.
+
+        Parameters:
+        scraper (api_scraper.MLB_Scrape): The scraper whose HTTP session downloads the images.
+        path (str): The directory the image bytes are written to. Default is 'image_cache'.
+        ttl (int): Seconds an image on disk is used before it is downloaded again. Default is 7 days.
+        max_items (int): The number of decoded images kept in memory. Default is 64.
+        """
+        self.scraper = scraper
+        self.path = path
+        self.ttl = ttl
+        self.max_items = max_items
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+        # Concurrent requests for the same image share one download
+        self._flight = api_scraper.SingleFlight()
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file(self, url: str):
+        # Name the file after a hash of the URL, which is too long and full of characters not allowed in file names
+        return os.path.join(self.path, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def get(self, url: str):
+        """
+        Retrieves a decoded image, from memory, from disk, or by downloading it.
+
+        Parameters:
+        url (str): The URL of the image.
+
+        Returns:
+        np.ndarray: The decoded image.
+        """
+        with self._lock:
+            img = self._images.get(url)
+            if img is not None:
+                self._images.move_to_end(url)
+                self.hits += 1
+                return img
+        return self._flight.do(url, lambda: self._load(url))
+
+    def _load(self, url: str):
+        # Read the bytes from disk while they are fresh, otherwise download them, then decode and keep the array in memory
+        path = self._file(url)
+        content = None
+        if os.path.exists(path) and time.time() - os.path.getmtime(path) < self.ttl:
+            with open(path, 'rb') as f:
+                content = f.read()
+            with self._lock:
+                self.disk_hits += 1
+
+        if content is None:
+            try:
+                response = self.scraper.session.get(url, timeout=self.scraper.timeout)
+                response.raise_for_status()
+                content = response.content
+            except Exception:
+                # Serve an expired copy rather than nothing when the image host is unavailable
+                if not os.path.exists(path):
+                    raise
+                with open(path, 'rb') as f:
+                    content = f.read()
+            else:
+                tmp_path = f'{path}.{threading.get_ident()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            with self._lock:
+                self.misses += 1
+
+        img = np.asarray(Image.open(BytesIO(content)))
+        with self._lock:
+            self._images[url] = img
+            while len(self._images) > self.max_items:
+                self._images.popitem(last=False)
+        return img
+
+    def prewarm(self, urls: list, max_workers: int = 8):
+        """
+        Loads a list of images into the cache ahead of time. Images that fail to download are skipped.
+
+        Parameters:
+        urls (list): The URLs of the images.
+        max_workers (int): The maximum number of images downloaded concurrently. Default is 8.
+        """
+        def load(url):
+            try:
+                self.get(url)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(load, urls))
+
+    def stats(self):
+        """
+        Reports the cache's counters.
+
+        Returns:
+        dict: The number of memory hits, disk hits, downloads, and images held in memory.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'disk_hits': self.disk_hits,
+                    'misses': self.misses,
+                    'images': len(self._images)}
+
+class FigureCache:
+    def __init__(self, max_bytes: int = 256 * 1024 ** 2):
+        """
+        In-memory LRU of rendered plots as encoded PNG bytes, keyed by a fingerprint of everything the plot is drawn from.
+
+        Parameters:
+        max_bytes (int): The total size of the PNGs kept. Least recently used plots are evicted beyond it. Default is 256 MB.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pngs = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(df: pl.DataFrame, *inputs):
+        """
+        Builds the cache key of a plot from its inputs and a hash of the pitch data's content.
+
+        Parameters:
+        df (pl.DataFrame): The filtered pitch data the plot is drawn from.
+        inputs: The other values the plot depends on, e.g. the pitcher ID, sport ID, plot type and filters.
+
+        Returns:
+        str: The cache key.
+        """
+        digest = hashlib.sha1(repr(inputs).encode('utf-8'))
+        digest.update(str(df.schema).encode('utf-8'))
+        digest.update(df.hash_rows(seed=0).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """
+        Retrieves a rendered plot.
+
+        Parameters:
+        key (str): The fingerprint of the plot.
+
+        Returns:
+        bytes: The PNG, or None if the plot is not cached.
+        """
+        with self._lock:
+            png = self._pngs.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._pngs.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key: str, png: bytes):
+        """
+        Stores a rendered plot.
+
+        Parameters:
+        key (str): The fingerprint of the plot.
+        png (bytes): The PNG.
+        """
+        with self._lock:
+            if key in self._pngs:
+                self._size -= len(self._pngs.pop(key))
+            self._pngs[key] = png
+            self._size += len(png)
+            # Keep the newest plot even when it alone exceeds the budget
+            while self._size > self.max_bytes and len(self._pngs) > 1:
+                self._size -= len(self._pngs.popitem(last=False)[1])
+                self.evictions += 1
+
+    def stats(self):
+        """
+        Reports the cache's counters.
+
+        Returns:
+        dict: The number of hits, misses, evictions, cached plots, and bytes held.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'plots': len(self._pngs),
+                    'bytes': self._size}
+
 class PitchPlotFunctions:
+    def __init__(self, scraper: api_scraper.MLB_Scrape = scraper, image_cache: ImageCache = None, figure_cache: FigureCache = None, render_workers: int = 2):
+        # Share the scraper's pooled HTTP session for every player, team and image request
+        self.scraper = scraper
+        # Headshots and logos are read through a memory and disk cache
+        self.image_cache = image_cache if image_cache is not None else ImageCache(scraper)
+        # Logo URL of each team ID, built from the scraper's team directory by logo_url
+        self._logo_urls = None
+        # Rendered plots, so identical requests skip matplotlib
+        self.figure_cache = figure_cache if figure_cache is not None else FigureCache()
+        # Threads fetching header assets while the main plot is drawn
+        self._asset_pool = ThreadPoolExecutor(max_workers=8)
+        # Threads plots are drawn and encoded on, bounded so concurrent sessions queue rather than each holding a full size raster
+        self._render_pool = ThreadPoolExecutor(max_workers=render_workers)
+        # Set the theme for seaborn plots once, renders only read it so they can run on several threads
+        sns.set_theme(style="whitegrid", rc=self.sns_custom_theme()[0])
+        # Pickled figure scaffolds keyed by plot type, pitcher hand, sport ID and dpi, see figure_template
+        self._templates = {}
+        self._template_lock = threading.Lock()
+
+    # Define the default_logo method
+    def default_logo(self):
+        # Logo shown when the team's logo is not known
+        return "https://a.espncdn.com/combiner/i?img=/i/teamlogos/leagues/500/mlb.png?w=500&h=500&transparent=true"
+
+    # Define the logo_url method
+    def logo_url(self, team_id: int):
+        """
+        Looks up the logo of a team, or of its parent club for minor league teams.
+
+        Parameters:
+        team_id (int): The ID of the team.
+
+        Returns:
+        str: The URL of the logo, or of the league logo if the team has none.
+        """
+        # Map every team ID to a logo URL once per refresh of the scraper's team directory
+        directory = self.scraper.get_team_directory()
+        if self._logo_urls is None or self._logo_urls[0] is not directory:
+            logos = self.team_logos()
+            self._logo_urls = (directory, {team_id: logos.get(team['parent_org_abbreviation'], self.default_logo()) for team_id, team in directory.items()})
+        return self._logo_urls[1].get(team_id, self.default_logo())
+
+    # Define the prewarm_logos method
+    def prewarm_logos(self):
+        # Load the team directory and every team logo into the caches so plots never wait on them
+        self.scraper.get_team_directory()
+        self.image_cache.prewarm(list(self.team_logos().values()) + [self.default_logo()])
+
     # Define the pitch_colours method
     def pitch_colours(self):
         # Dictionary of pitch types and their corresponding colors and names
@@ -140,15 +405,17 @@ class PitchPlotFunctions:
 
         return image_dict
 
-    # Function to get an image from a URL and display it on the given axis
-    def player_headshot(self, pitcher_id: str, ax: plt.Axes, sport_id: int):
+    # Function to fetch a player's headshot image
+    def fetch_headshot(self, pitcher_id: str, sport_id: int):
         """
-        Fetches and displays the player's headshot image on the given axis.
+        Fetches the player's headshot image.
 
         Parameters:
         pitcher_id (str): The ID of the pitcher.
-        ax (plt.Axes): The matplotlib axis to display the image on.
         sport_id (int): The sport ID to determine the URL format.
+
+        Returns:
+        np.ndarray: The headshot image.
         """
         # Construct the URL for the player's headshot image
         if sport_id == 1:
@@ -158,10 +425,91 @@ class PitchPlotFunctions:
         else:
             url = f'https://img.mlbstatic.com/mlb-photos/image/upload/c_fill,g_auto/w_640/v1/people/{pitcher_id}/headshot/milb/current.png'
         
-        # Send a GET request to the URL
-        response = requests.get(url)
-        # Open the image from the response content
-        img = Image.open(BytesIO(response.content))
+        # Read the image through the cache
+        return self.image_cache.get(url)
+
+    # Function to fetch a player's bio and current team
+    def fetch_player(self, pitcher_id: str):
+        """
+        Fetches the player's bio information, hydrated with the current team, through the scraper's cached player metadata.
+
+        Parameters:
+        pitcher_id (str): The ID of the pitcher.
+
+        Returns:
+        dict: The player's entry of the people endpoint.
+        """
+        return self.scraper.get_player_metadata([pitcher_id])[int(pitcher_id)]
+
+    # Function to fetch the logo of a player's team
+    def fetch_logo(self, player: dict):
+        """
+        Fetches the logo of the player's team, or of its parent club for minor league teams. The team is resolved from the scraper's cached team directory.
+
+        Parameters:
+        player (dict): The player's entry of the people endpoint, as returned by fetch_player.
+
+        Returns:
+        np.ndarray: The logo image.
+        """
+        # Look the logo up from the team the player currently plays for
+        logo_url = self.logo_url(player['currentTeam']['id'])
+        # Read the image through the cache
+        return self.image_cache.get(logo_url)
+
+    # Function to fetch everything the header of the plot needs
+    def header_assets(self, pitcher_id: str, sport_id: int):
+        """
+        Fetches the headshot, bio and team logo shown in the header of the plot, so they can be reused across plots of the same pitcher.
+        When plotting several pitchers, request them together first with scraper.get_player_metadata so their bios come from one call.
+
+        Parameters:
+        pitcher_id (str): The ID of the pitcher.
+        sport_id (int): The sport ID to determine the headshot URL format.
+
+        Returns:
+        dict: The headshot image, the player's bio and the logo image.
+        """
+        return {k: v.result() for k, v in self.start_header_assets(pitcher_id=pitcher_id, sport_id=sport_id).items()}
+
+    # Function to start fetching the header assets in the background
+    def start_header_assets(self, pitcher_id: str, sport_id: int, timings: dict = None):
+        """
+        Starts fetching the headshot, bio and team logo concurrently on the asset pool.
+
+        Parameters:
+        pitcher_id (str): The ID of the pitcher.
+        sport_id (int): The sport ID to determine the headshot URL format.
+        timings (dict): An optional dict the seconds spent fetching each asset are written to. Default is None.
+
+        Returns:
+        dict: Futures of the headshot image, the player's bio and the logo image.
+        """
+        def timed(name, fn, *args):
+            start = time.perf_counter()
+            result = fn(*args)
+            if timings is not None:
+                timings[f'fetch_{name}'] = time.perf_counter() - start
+            return result
+
+        # The logo fetches the bio itself rather than waiting on the bio's future, the cached metadata makes the second lookup free
+        return {'headshot': self._asset_pool.submit(timed, 'headshot', self.fetch_headshot, pitcher_id, sport_id),
+                'player': self._asset_pool.submit(timed, 'player', self.fetch_player, pitcher_id),
+                'logo': self._asset_pool.submit(timed, 'logo', lambda: self.fetch_logo(self.fetch_player(pitcher_id)))}
+
+    # Function to get an image from a URL and display it on the given axis
+    def player_headshot(self, pitcher_id: str, ax: plt.Axes, sport_id: int, img: np.ndarray = None):
+        """
+        Fetches and displays the player's headshot image on the given axis.
+
+        Parameters:
+        pitcher_id (str): The ID of the pitcher.
+        ax (plt.Axes): The matplotlib axis to display the image on.
+        sport_id (int): The sport ID to determine the URL format.
+        img (np.ndarray): An already fetched headshot. Default is None, which fetches it.
+        """
+        if img is None:
+            img = self.fetch_headshot(pitcher_id, sport_id)
         # Display the image on the axis
         ax.set_xlim(0, 2)
         ax.set_ylim(0, 1)
@@ -170,7 +518,7 @@ class PitchPlotFunctions:
         ax.axis('off')
 
     # Function to display player bio information on the given axis
-    def player_bio(self, pitcher_id: str, ax: plt.Axes, start_date: str, end_date: str, batter_hand: list):
+    def player_bio(self, pitcher_id: str, ax: plt.Axes, start_date: str, end_date: str, batter_hand: list, player: dict = None):
         """
         Fetches and displays the player's bio information on the given axis.
 
@@ -180,17 +528,16 @@ class PitchPlotFunctions:
         start_date (str): The start date for the bio information.
         end_date (str): The end date for the bio information.
         batter_hand (list): The list of batter hands (e.g., ['R'] or ['L']).
+        player (dict): An already fetched bio. Default is None, which fetches it.
         """
-        # Construct the URL to fetch player data
-        url = f"https://statsapi.mlb.com/api/v1/people?personIds={pitcher_id}&hydrate=currentTeam"
-        # Send a GET request to the URL and parse the JSON response
-        data = requests.get(url).json()
+        if player is None:
+            player = self.fetch_player(pitcher_id)
         # Extract player information from the JSON data
-        player_name = data['people'][0]['fullName']
-        pitcher_hand = data['people'][0]['pitchHand']['code']
-        age = data['people'][0]['currentAge']
-        height = data['people'][0]['height']
-        weight = data['people'][0]['weight']
+        player_name = player['fullName']
+        pitcher_hand = player['pitchHand']['code']
+        age = player['currentAge']
+        height = player['height']
+        weight = player['weight']
         # Display the player's name, handedness, age, height, and weight on the axis
         ax.text(0.5, 1, f'{player_name}', va='top', ha='center', fontsize=48)
         ax.text(0.5, 0.6, f'{pitcher_hand}HP, Age: {age}, {height}/{weight}', va='top', ha='center', fontsize=22)
@@ -206,36 +553,17 @@ class PitchPlotFunctions:
         ax.axis('off')
 
     # Function to display the team logo on the given axis
-    def plot_logo(self, pitcher_id: str, ax: plt.Axes):
+    def plot_logo(self, pitcher_id: str, ax: plt.Axes, img: np.ndarray = None):
         """
         Fetches and displays the team logo on the given axis.
 
         Parameters:
         pitcher_id (str): The ID of the pitcher.
         ax (plt.Axes): The matplotlib axis to display the logo on.
+        img (np.ndarray): An already fetched logo. Default is None, which fetches it.
         """
-        # Construct the URL to fetch player data
-        url = f"https://statsapi.mlb.com/api/v1/people?personIds={pitcher_id}&hydrate=currentTeam"
-        # Send a GET request to the URL and parse the JSON response
-        data = requests.get(url).json()
-        # Construct the URL to fetch team data
-        url_team = 'https://statsapi.mlb.com/' + data['people'][0]['currentTeam']['link']
-        # Send a GET request to the team URL and parse the JSON response
-        data_team = requests.get(url_team).json()
-        # Get the logo URL from the image dictionary using the team abbreviation
-        try:
-            if data_team['teams'][0]['sport']['id'] == 1:
-                team_abb = data_team['teams'][0]['abbreviation']
-                logo_url = self.team_logos()[team_abb]
-            else:
-                team_abb = data_team['teams'][0]['parentOrgId']
-                logo_url = self.team_logos()[dict(scraper.get_teams().select(['team_id', 'parent_org_abbreviation']).iter_rows())[team_abb]]
-        except KeyError:
-            logo_url = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/leagues/500/mlb.png?w=500&h=500&transparent=true"
-        # Send a GET request to the logo URL
-        response = requests.get(logo_url)
-        # Open the image from the response content
-        img = Image.open(BytesIO(response.content))
+        if img is None:
+            img = self.fetch_logo(self.fetch_player(pitcher_id))
         # Display the image on the axis
         ax.set_xlim(0, 2)
         ax.set_ylim(0, 1)
@@ -270,9 +598,40 @@ class PitchPlotFunctions:
         
         if x.shape != y.shape:
             raise ValueError("x and y must be the same size")
+        cov = np.cov(x, y)
+        return self.confidence_ellipse_from_stats(np.mean(x), np.mean(y), cov[0, 0], cov[1, 1], cov[0, 1],
+                                                  ax=ax, n_std=n_std, facecolor=facecolor, **kwargs)
+
+    def confidence_ellipse_from_stats(self,
+                                      mean_x: float,
+                                      mean_y: float,
+                                      var_x: float,
+                                      var_y: float,
+                                      cov_xy: float,
+                                      ax: plt.Axes,
+                                      n_std: float = 3.0,
+                                      facecolor: str = 'none',
+                                      **kwargs):
+        """
+        Create a plot of the covariance confidence ellipse from the means, variances and covariance of *x* and *y*.
+        Parameters
+        ----------
+        mean_x, mean_y : float
+            Means of the data.
+        var_x, var_y, cov_xy : float
+            Sample variances and covariance of the data.
+        ax : matplotlib.axes.Axes
+            The axes object to draw the ellipse into.
+        n_std : float
+            The number of standard deviations to determine the ellipse's radiuses.
+        **kwargs
+            Forwarded to `~matplotlib.patches.Ellipse`
+        Returns
+        -------
+        matplotlib.patches.Ellipse
+        """
         try:
-            cov = np.cov(x, y)
-            pearson = cov[0, 1]/np.sqrt(cov[0, 0] * cov[1, 1])
+            pearson = cov_xy/np.sqrt(var_x * var_y)
             # Using a special case to obtain the eigenvalues of this
             # two-dimensional dataset.
             ell_radius_x = np.sqrt(1 + pearson)
@@ -284,13 +643,11 @@ class PitchPlotFunctions:
             # Calculating the standard deviation of x from
             # the squareroot of the variance and multiplying
             # with the given number of standard deviations.
-            scale_x = np.sqrt(cov[0, 0]) * n_std
-            mean_x = x.mean()
+            scale_x = np.sqrt(var_x) * n_std
             
 
             # calculating the standard deviation of y ...
-            scale_y = np.sqrt(cov[1, 1]) * n_std
-            mean_y = y.mean()
+            scale_y = np.sqrt(var_y) * n_std
             
 
             transf = transforms.Affine2D() \
@@ -306,8 +663,100 @@ class PitchPlotFunctions:
             
         return ax.add_patch(ellipse)
 
+    def pitch_type_summary(self, df: pl.DataFrame):
+        """
+        Summarises each pitch type in one pass: its share of pitches, and the count, means, variances and covariances of (hb, ivb) and (hb, vb).
+
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data, as returned by df_to_polars.
+
+        Returns:
+        pl.DataFrame: One row per pitch type, sorted by 'prop' ascending and 'pitch_type' descending.
+        """
+        return (df.group_by('pitch_type')
+                .agg(pl.len().alias('count'),
+                     pl.col('prop').first(),
+                     pl.col('hb').mean().alias('mean_hb'),
+                     pl.col('ivb').mean().alias('mean_ivb'),
+                     pl.col('vb').mean().alias('mean_vb'),
+                     pl.col('hb').var().alias('var_hb'),
+                     pl.col('ivb').var().alias('var_ivb'),
+                     pl.col('vb').var().alias('var_vb'),
+                     pl.cov('hb', 'ivb').alias('cov_hb_ivb'),
+                     pl.cov('hb', 'vb').alias('cov_hb_vb'))
+                .sort(by=['prop', 'pitch_type'], descending=[False, True]))
+
+    def plot_ellipses(self, df: pl.DataFrame, ax: plt.Axes, y: str, summary: pl.DataFrame = None):
+        """
+        Plots a 2 standard deviation confidence ellipse of hb against a vertical break column for each pitch type thrown more than 4 times.
+
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data.
+        ax (plt.Axes): The matplotlib axis to plot on.
+        y (str): The vertical break column, 'ivb' or 'vb'.
+        summary (pl.DataFrame): The pitch type summary as returned by pitch_type_summary. Default is None, which computes it.
+        """
+        if summary is None:
+            summary = self.pitch_type_summary(df)
+        dict_colour, dict_pitch = self.pitch_colours()
+
+        # Mirror the horizontal break of left-handed pitchers, which flips the sign of its mean and covariance
+        sign = -1 if df['pitcher_hand'][0] == 'L' else 1
+
+        for row in summary.filter(pl.col('count') > 4).iter_rows(named=True):
+            label = row['pitch_type']
+            self.confidence_ellipse_from_stats(row['mean_hb'] * sign, row[f'mean_{y}'], row['var_hb'], row[f'var_{y}'], row[f'cov_hb_{y}'] * sign,
+                                               ax=ax, edgecolor=dict_colour[label], n_std=2, facecolor=dict_colour[label], alpha=0.2)
+
     
-    def break_plot_big(self, df: pl.DataFrame, ax: plt.Axes, sport_id: int):
+    def scatter_pitches(self, df: pl.DataFrame, ax: plt.Axes, x: str, y: str, x_sign: int = 1):
+        """
+        Plots every pitch as one scatter collection coloured by pitch type, drawn to look like the seaborn scatterplot it replaces.
+
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data.
+        ax (plt.Axes): The matplotlib axis to plot on.
+        x (str): The column plotted on the x axis.
+        y (str): The column plotted on the y axis.
+        x_sign (int): 1, or -1 to mirror the x axis values. Default is 1.
+
+        Returns:
+        matplotlib.collections.PathCollection: The scatter collection.
+        """
+        dict_colour, dict_pitch = self.pitch_colours()
+
+        # Look up the RGBA colour of each pitch type once, then index it by each pitch's position in that table
+        pitch_types = df['pitch_type'].cast(pl.String)
+        labels = pitch_types.unique().to_list()
+        colour_table = mcolors.to_rgba_array([dict_colour[label] for label in labels])
+        colours = colour_table[pitch_types.replace_strict(labels, list(range(len(labels))), return_dtype=pl.UInt32).to_numpy()]
+
+        # seaborn's default edge width for markers of size 50
+        return ax.scatter(df[x].to_numpy() * x_sign, df[y].to_numpy(), c=colours, s=50, marker='o',
+                          edgecolor='black', linewidth=0.08 * np.sqrt(50), alpha=1, zorder=2)
+
+    def plot_pitches(self, df: pl.DataFrame, ax: plt.Axes, plot_picker: str, summary: pl.DataFrame = None):
+        """
+        Plots the data of the selected plot type, the pitches and, for the movement plots, the confidence ellipses, on the provided axis.
+
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data.
+        ax (plt.Axes): The matplotlib axis to plot on.
+        plot_picker (str): The type of plot ('short_form_movement', 'long_form_movement', 'release_point').
+        summary (pl.DataFrame): The pitch type summary as returned by pitch_type_summary. Default is None, which computes it.
+        """
+        if plot_picker == 'short_form_movement':
+            # Plot confidence ellipses for each pitch type from the summary table, then the pitches
+            self.plot_ellipses(df, ax, y='ivb', summary=summary)
+            self.scatter_pitches(df, ax, x='hb', y='ivb', x_sign=-1 if df['pitcher_hand'][0] == 'L' else 1)
+        elif plot_picker == 'long_form_movement':
+            self.plot_ellipses(df, ax, y='vb', summary=summary)
+            self.scatter_pitches(df, ax, x='hb', y='vb', x_sign=-1 if df['pitcher_hand'][0] == 'L' else 1)
+        elif plot_picker == 'release_point':
+            # Plot scatter plot of release points based on pitcher hand
+            self.scatter_pitches(df, ax, x='x0', y='z0', x_sign=-1 if df['pitcher_hand'][0] == 'R' else 1)
+
+    def break_plot_big(self, df: pl.DataFrame, ax: plt.Axes, sport_id: int, summary: pl.DataFrame = None):
         """
         Plots a big break plot for the given DataFrame on the provided axis.
 
@@ -315,69 +764,56 @@ class PitchPlotFunctions:
         df (pl.DataFrame): The DataFrame containing pitch data.
         ax (plt.Axes): The matplotlib axis to plot on.
         sport_id (int): The sport ID to determine the plot title.
+        summary (pl.DataFrame): The pitch type summary as returned by pitch_type_summary. Default is None, which computes it.
+        """
+        self.plot_pitches(df, ax, plot_picker='short_form_movement', summary=summary)
+        self.break_plot_big_frame(ax, sport_id=sport_id, pitcher_hand=df['pitcher_hand'][0])
+
+    def break_plot_big_frame(self, ax: plt.Axes, sport_id: int, pitcher_hand: str):
+        """
+        Draws everything of the big break plot that does not depend on the pitches: limits, labels, title, ticks and hand annotations.
+
+        Parameters:
+        ax (plt.Axes): The matplotlib axis to plot on.
+        sport_id (int): The sport ID to determine the plot title.
+        pitcher_hand (str): The pitcher's throwing hand, 'R' or 'L'.
         """
         # Set font properties for different elements of the plot
         font_properties = {'size': 20}
         font_properties_titles = {'size': 32}
         font_properties_axes = {'size': 24}
         
-        # Get unique pitch types sorted by 'prop' and 'pitch_type'
-        label_labels = df.sort(by=['prop', 'pitch_type'], descending=[False, True])['pitch_type'].unique()
-        j = 0
-        dict_colour, dict_pitch = self.pitch_colours()
         custom_theme, colour_palette = self.sns_custom_theme()
         
-        # Loop through each pitch type and plot confidence ellipses
-        for label in label_labels:
-            subset = df.filter(pl.col('pitch_type') == label)
-            if len(subset) > 4:
-                try:
-                    if df['pitcher_hand'][0] == 'R':
-                        self.confidence_ellipse(subset['hb'], subset['ivb'], ax=ax, edgecolor=dict_colour[label], n_std=2, facecolor=dict_colour[label], alpha=0.2)
-                    if df['pitcher_hand'][0] == 'L':
-                        self.confidence_ellipse(subset['hb'] * -1, subset['ivb'], ax=ax, edgecolor=dict_colour[label], n_std=2, facecolor=dict_colour[label], alpha=0.2)
-                except ValueError:
-                    return
-                j += 1
-            else:
-                j += 1
-        
-        # Plot scatter plot of pitch data
-        if df['pitcher_hand'][0] == 'R':
-            sns.scatterplot(ax=ax, x=df['hb'] * 1, y=df['ivb'] * 1, hue=df['pitch_type'], palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
-        if df['pitcher_hand'][0] == 'L':
-            sns.scatterplot(ax=ax, x=df['hb'] * -1, y=df['ivb'] * 1, hue=df['pitch_type'], palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
-        
-        # Set plot limits and labels
+        # Set plot limits and labels, the zero lines stay over the ellipses whichever is drawn first
         ax.set_xlim((-25, 25))
         ax.set_ylim((-25, 25))
-        ax.hlines(y=0, xmin=-50, xmax=50, color=colour_palette[8], alpha=0.5, linestyles='--', zorder=1)
-        ax.vlines(x=0, ymin=-50, ymax=50, color=colour_palette[8], alpha=0.5, linestyles='--', zorder=1)
+        ax.hlines(y=0, xmin=-50, xmax=50, color=colour_palette[8], alpha=0.5, linestyles='--', zorder=1.5)
+        ax.vlines(x=0, ymin=-50, ymax=50, color=colour_palette[8], alpha=0.5, linestyles='--', zorder=1.5)
         ax.set_xlabel('Horizontal Break (in)', fontdict=font_properties_axes)
         ax.set_ylabel('Induced Vertical Break (in)', fontdict=font_properties_axes)
         ax.set_title(f"{self.sport_id_dict()[sport_id]} - Short Form Pitch Movement Plot", fontdict=font_properties_titles)
         
-        # Remove legend and set tick labels
-        ax.get_legend().remove()
+        # Set tick labels
         ax.set_xticklabels(ax.get_xticks(), fontdict=font_properties)
         ax.set_yticklabels(ax.get_yticks(), fontdict=font_properties)
         
         # Add text annotations based on pitcher hand
-        if df['pitcher_hand'][0] == 'R':
+        if pitcher_hand == 'R':
             ax.text(-24.5, -24.5, s='← Glove Side', fontstyle='italic', ha='left', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
             ax.text(24.5, -24.5, s='Arm Side →', fontstyle='italic', ha='right', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
-        if df['pitcher_hand'][0] == 'L':
+        if pitcher_hand == 'L':
             ax.invert_xaxis()
             ax.text(24.5, -24.5, s='← Arm Side', fontstyle='italic', ha='left', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
             ax.text(-24.5, -24.5, s='Glove Side →', fontstyle='italic', ha='right', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
         
         # Set aspect ratio and format tick labels
         ax.set_aspect('equal', adjustable='box')
-        ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: int(x)))
-        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: int(x)))
+        ax.xaxis.set_major_formatter(FuncFormatter(int_tick))
+        ax.yaxis.set_major_formatter(FuncFormatter(int_tick))
 
     ### BREAK PLOT ###
-    def break_plot_big_long(self, df: pl.DataFrame, ax: plt.Axes, sport_id: int):
+    def break_plot_big_long(self, df: pl.DataFrame, ax: plt.Axes, sport_id: int, summary: pl.DataFrame = None):
         """
         Plots a long break plot for the given DataFrame on the provided axis.
 
@@ -385,67 +821,53 @@ class PitchPlotFunctions:
         df (pl.DataFrame): The DataFrame containing pitch data.
         ax (plt.Axes): The matplotlib axis to plot on.
         sport_id (int): The sport ID to determine the plot title.
+        summary (pl.DataFrame): The pitch type summary as returned by pitch_type_summary. Default is None, which computes it.
+        """
+        self.plot_pitches(df, ax, plot_picker='long_form_movement', summary=summary)
+        self.break_plot_big_long_frame(ax, sport_id=sport_id, pitcher_hand=df['pitcher_hand'][0])
+
+    def break_plot_big_long_frame(self, ax: plt.Axes, sport_id: int, pitcher_hand: str):
+        """
+        Draws everything of the long break plot that does not depend on the pitches: limits, labels, title, ticks and hand annotations.
+
+        Parameters:
+        ax (plt.Axes): The matplotlib axis to plot on.
+        sport_id (int): The sport ID to determine the plot title.
+        pitcher_hand (str): The pitcher's throwing hand, 'R' or 'L'.
         """
         # Set font properties for different elements of the plot
         font_properties = {'size': 20}
         font_properties_titles = {'size': 32}
         font_properties_axes = {'size': 24}
         
-        # Get unique pitch types sorted by 'prop' and 'pitch_type'
-        label_labels = df.sort(by=['prop', 'pitch_type'], descending=[False, True])['pitch_type'].unique()
-        dict_colour, dict_pitch = self.pitch_colours()
         custom_theme, colour_palette = self.sns_custom_theme()
-        j = 0
-        
-        # Loop through each pitch type and plot confidence ellipses
-        for label in label_labels:
-            subset = df.filter(pl.col('pitch_type') == label)
-            print(label)
-            if len(subset) > 4:
-                try:
-                    if df['pitcher_hand'][0] == 'R':
-                        self.confidence_ellipse(subset['hb'], subset['vb'], ax=ax, edgecolor=dict_colour[label], n_std=2, facecolor=dict_colour[label], alpha=0.2)
-                    if df['pitcher_hand'][0] == 'L':
-                        self.confidence_ellipse(subset['hb'] * -1, subset['vb'], ax=ax, edgecolor=dict_colour[label], n_std=2, facecolor=dict_colour[label], alpha=0.2)
-                except ValueError:
-                    return
-                j += 1
-            else:
-                j += 1
-        
-        # Plot scatter plot of pitch data
-        if df['pitcher_hand'][0] == 'R':
-            sns.scatterplot(ax=ax, x=df['hb'] * 1, y=df['vb'] * 1, hue=df['pitch_type'], palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
-        if df['pitcher_hand'][0] == 'L':
-            sns.scatterplot(ax=ax, x=df['hb'] * -1, y=df['vb'] * 1, hue=df['pitch_type'], palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
         
-        # Set plot limits and labels
+        # Set plot limits and labels, the zero lines stay over the ellipses whichever is drawn first
         ax.set_xlim((-40, 40))
         ax.set_ylim((-80, 0))
-        ax.axhline(y=0, color=colour_palette[8], alpha=0.5, linestyle='--', zorder=1)
-        ax.axvline(x=0, color=colour_palette[8], alpha=0.5, linestyle='--', zorder=1)
+        ax.axhline(y=0, color=colour_palette[8], alpha=0.5, linestyle='--', zorder=1.5)
+        ax.axvline(x=0, color=colour_palette[8], alpha=0.5, linestyle='--', zorder=1.5)
         ax.set_xlabel('Horizontal Break (in)', fontdict=font_properties_axes)
         ax.set_ylabel('Vertical Break (in)', fontdict=font_properties_axes)
         ax.set_title(f"{self.sport_id_dict()[sport_id]} - Long Form Pitch Movement Plot", fontdict=font_properties_titles)
         
-        # Remove legend and set tick labels
-        ax.get_legend().remove()
+        # Set tick labels
         ax.set_xticklabels(ax.get_xticks(), fontdict=font_properties)
         ax.set_yticklabels(ax.get_yticks(), fontdict=font_properties)
         
         # Add text annotations based on pitcher hand
-        if df['pitcher_hand'][0] == 'R':
+        if pitcher_hand == 'R':
             ax.text(-39.5, -79.5, s='← Glove Side', fontstyle='italic', ha='left', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
             ax.text(39.5, -79.5, s='Arm Side →', fontstyle='italic', ha='right', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
-        if df['pitcher_hand'][0] == 'L':
+        if pitcher_hand == 'L':
             ax.invert_xaxis()
             ax.text(39.5, -79.5, s='← Arm Side', fontstyle='italic', ha='left', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
             ax.text(-39.5, -79.5, s='Glove Side →', fontstyle='italic', ha='right', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
         
         # Set aspect ratio and format tick labels
         ax.set_aspect('equal', adjustable='box')
-        ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: int(x)))
-        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: int(x)))
+        ax.xaxis.set_major_formatter(FuncFormatter(int_tick))
+        ax.yaxis.set_major_formatter(FuncFormatter(int_tick))
 
     ### BREAK PLOT ###
     def release_point_plot(self, df: pl.DataFrame, ax: plt.Axes, sport_id: int):
@@ -457,22 +879,27 @@ class PitchPlotFunctions:
         ax (plt.Axes): The matplotlib axis to plot on.
         sport_id (int): The sport ID to determine the plot title.
         """
+        self.plot_pitches(df, ax, plot_picker='release_point')
+        self.release_point_frame(ax, sport_id=sport_id, pitcher_hand=df['pitcher_hand'][0])
+
+    def release_point_frame(self, ax: plt.Axes, sport_id: int, pitcher_hand: str):
+        """
+        Draws everything of the release point plot that does not depend on the pitches: the mound, limits, labels, title, ticks and hand annotations.
+
+        Parameters:
+        ax (plt.Axes): The matplotlib axis to plot on.
+        sport_id (int): The sport ID to determine the plot title.
+        pitcher_hand (str): The pitcher's throwing hand, 'R' or 'L'.
+        """
         # Set font properties for different elements of the plot
         font_properties = {'size': 20}
         font_properties_titles = {'size': 32}
         font_properties_axes = {'size': 24}
-        dict_colour, dict_pitch = self.pitch_colours()
         custom_theme, colour_palette = self.sns_custom_theme()
         
-        # Plot scatter plot of release points based on pitcher hand
-        if df['pitcher_hand'][0] == 'R':
-            sns.scatterplot(ax=ax, x=df['x0'] * -1, y=df['z0'] * 1, hue=df['pitch_type'], palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
-        if df['pitcher_hand'][0] == 'L':
-            sns.scatterplot(ax=ax, x=df['x0'] * 1, y=df['z0'] * 1, hue=df['pitch_type'], palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
-        
         # Add patches to the plot
-        ax.add_patch(plt.Circle((0, 10 / 12 - 18), radius=18, edgecolor='black', facecolor='#a63b17'))
-        ax.add_patch(plt.Rectangle((-0.5, 9 / 12), 1, 1 / 6, edgecolor='black', facecolor='white'))
+        ax.add_patch(mpatches.Circle((0, 10 / 12 - 18), radius=18, edgecolor='black', facecolor='#a63b17'))
+        ax.add_patch(mpatches.Rectangle((-0.5, 9 / 12), 1, 1 / 6, edgecolor='black', facecolor='white'))
         
         # Set plot limits and labels
         ax.set_xlim((-4, 4))
@@ -483,31 +910,32 @@ class PitchPlotFunctions:
         ax.set_xlabel('Horizontal Release (ft)', fontdict=font_properties_axes)
         ax.set_title(f"{self.sport_id_dict()[sport_id]} - Release Points Catcher Perspective", fontdict=font_properties_titles)
         
-        # Remove legend and set tick labels
-        ax.get_legend().remove()
+        # Set tick labels
         ax.set_xticklabels(ax.get_xticks(), fontdict=font_properties)
         ax.set_yticklabels(ax.get_yticks(), fontdict=font_properties)
         
         # Add text annotations based on pitcher hand
-        if df['pitcher_hand'][0] == 'L':
+        if pitcher_hand == 'L':
             ax.text(-3.95, 0.05, s='← Glove Side', fontstyle='italic', ha='left', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
             ax.text(3.95, 0.05, s='Arm Side →', fontstyle='italic', ha='right', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
-        if df['pitcher_hand'][0] == 'R':
+        if pitcher_hand == 'R':
             ax.invert_xaxis()
             ax.text(3.95, 0.05, s='← Arm Side', fontstyle='italic', ha='left', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
             ax.text(-3.95, 0.05, s='Glove Side →', fontstyle='italic', ha='right', va='bottom', bbox=dict(facecolor='white', edgecolor='black'), fontsize=16, zorder=3)
         
         # Set aspect ratio and format tick labels
         ax.set_aspect('equal', adjustable='box')
-        ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: int(x)))
-        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: int(x)))
+        ax.xaxis.set_major_formatter(FuncFormatter(int_tick))
+        ax.yaxis.set_major_formatter(FuncFormatter(int_tick))
 
     def df_to_polars(self, df_original: pl.DataFrame, pitcher_id: str, start_date: str, end_date: str, batter_hand: list):
         """
         Filters and processes the original DataFrame to a Polars DataFrame.
+        A LazyFrame (e.g. from api_scraper.PitchStore.scan) is filtered before it is read, so only the matching files and row groups are loaded.
+        The Categorical columns are cast to their lexical ordering once the data is read.
 
         Parameters:
-        df_original (pl.DataFrame): The original DataFrame containing pitch data.
+        df_original (pl.DataFrame | pl.LazyFrame): The original DataFrame containing pitch data.
         pitcher_id (str): The ID of the pitcher.
         start_date (str): The start date for filtering the data.
         end_date (str): The end date for filtering the data.
@@ -516,71 +944,148 @@ class PitchPlotFunctions:
         Returns:
         pl.DataFrame: The filtered and processed Polars DataFrame.
         """
-        df = df_original.clone()
+        df = df_original.lazy()
         df = df.filter((pl.col('pitcher_id') == pitcher_id) & 
                        (pl.col('is_pitch')) & (pl.col('pitch_type').is_not_null()) &
-                       (pl.col('pitch_type') != 'NaN') &
-                       (pl.col('game_date') >= start_date) &
-                       (pl.col('game_date') <= end_date) &
+                       (pl.col('game_date') >= date.fromisoformat(start_date)) &
+                       (pl.col('game_date') <= date.fromisoformat(end_date)) &
                        (pl.col('batter_hand').is_in(batter_hand)))
         df = df.with_columns(
             prop_percent=(pl.col('is_pitch') / pl.col('is_pitch').sum()).over("pitch_type"),
             prop=pl.col('is_pitch').sum().over("pitch_type")
         )
-        return df
+        return df.collect().cast(api_scraper.PITCH_CATEGORICALS)
     
-    def final_plot(self, df: pl.DataFrame, pitcher_id: str, plot_picker: str, sport_id: int):
+    def build_template(self, plot_picker: str, pitcher_hand: str, sport_id: int, dpi: int = 400):
+        """
+        Creates the figure scaffold shared by every plot of one type, pitcher hand and sport: the gridspec, the frame of the main plot, the footer and the borders, laid out.
+        Each axis is labelled with its role so a copy of the figure can be filled in by build_plot.
+
+        Parameters:
+        plot_picker (str): The type of plot to create ('short_form_movement', 'long_form_movement', 'release_point').
+        pitcher_hand (str): The pitcher's throwing hand, 'R' or 'L'.
+        sport_id (int): The sport ID to determine the plot title.
+        dpi (int): The resolution the figure is laid out at, see RENDER_QUALITY. Default is 400.
+
+        Returns:
+        matplotlib.figure.Figure: The empty figure.
+        """
+        # Create a figure on its own Agg canvas, outside pyplot's global figure list, and a gridspec with 6 rows and 5 columns
+        fig = Figure(figsize=(16, 16), dpi=dpi)
+        FigureCanvasAgg(fig)
+        gs = gridspec.GridSpec(6, 5, figure=fig, height_ratios=[0.00000000005, 5, 30, 5, 2, 0.00000000005], width_ratios=[1, 10, 10, 10, 1])
+
+        # Create subplots for player headshot, bio, and logo
+        fig.add_subplot(gs[1, 1], label='headshot')
+        fig.add_subplot(gs[1, 2], label='bio')
+        fig.add_subplot(gs[1, 3], label='logo')
+
+        # Create subplot for the main plot and draw its frame
+        ax_main_plot = fig.add_subplot(gs[2, :], label='main_plot')
+        if plot_picker == 'short_form_movement':
+            self.break_plot_big_frame(ax_main_plot, sport_id=sport_id, pitcher_hand=pitcher_hand)
+        elif plot_picker == 'long_form_movement':
+            self.break_plot_big_long_frame(ax_main_plot, sport_id=sport_id, pitcher_hand=pitcher_hand)
+        elif plot_picker == 'release_point':
+            self.release_point_frame(ax_main_plot, sport_id=sport_id, pitcher_hand=pitcher_hand)
+
+        # Create subplot for the legend
+        ax_legend = fig.add_subplot(gs[3, :], label='legend')
+        ax_legend.axis('off')
+
+        # Create subplot for the footer and add footer text
+        ax_footer = fig.add_subplot(gs[-2, :], label='footer')
+        ax_footer.text(x=0.075, y=1, s='By: Thomas Nestico\n      @TJStats', fontname=FOOTER_FONT, ha='left', fontsize=24, va='top')
+        ax_footer.text(x=1-0.075, y=1, s='Data: MLB', ha='right', fontname=FOOTER_FONT, fontsize=24, va='top')
+        ax_footer.axis('off')
+
+        # Create subplots for the borders
+        ax_top_border = fig.add_subplot(gs[0, :], label='top_border')
+        ax_left_border = fig.add_subplot(gs[:, 0], label='left_border')
+        ax_right_border = fig.add_subplot(gs[:, -1], label='right_border')
+        ax_bottom_border = fig.add_subplot(gs[-1, :], label='bottom_border')
+
+        # Turn off the axes for the border subplots
+        ax_top_border.axis('off')
+        ax_left_border.axis('off')
+        ax_right_border.axis('off')
+        ax_bottom_border.axis('off')
+
+        # Adjust layout
+        fig.tight_layout()
+        fig.subplots_adjust(hspace=0.1, wspace=0.1)
+        return fig
+
+    def figure_template(self, plot_picker: str, pitcher_hand: str, sport_id: int, dpi: int = 400):
+        """
+        Returns a fresh copy of the figure scaffold from build_template, which is built and pickled on first use.
+
+        Parameters:
+        plot_picker (str): The type of plot to create ('short_form_movement', 'long_form_movement', 'release_point').
+        pitcher_hand (str): The pitcher's throwing hand, 'R' or 'L'.
+        sport_id (int): The sport ID to determine the plot title.
+        dpi (int): The resolution the figure is laid out at, see RENDER_QUALITY. Default is 400.
+
+        Returns:
+        tuple: The figure and a dict of its axes by label.
+        """
+        key = (plot_picker, pitcher_hand, sport_id, dpi)
+        with self._template_lock:
+            template = self._templates.get(key)
+            if template is None:
+                fig = self.build_template(plot_picker=plot_picker, pitcher_hand=pitcher_hand, sport_id=sport_id, dpi=dpi)
+                self._templates[key] = pickle.dumps(fig)
+                template = self._templates[key]
+
+        # An unpickled figure has no canvas of its own
+        fig = pickle.loads(template)
+        FigureCanvasAgg(fig)
+        return fig, {ax.get_label(): ax for ax in fig.axes}
+
+    def build_plot(self, df: pl.DataFrame, pitcher_id: str, plot_picker: str, sport_id: int, assets: dict = None, timings: dict = None, dpi: int = 400):
         """
         Creates a final plot with player headshot, bio, logo, and pitch movement plots.
+        The scaffold comes from figure_template, so only the pitches, legend and header are drawn here.
+        The header assets are fetched in the background while the main plot and legend are drawn.
 
         Parameters:
         df (pl.DataFrame): The DataFrame containing pitch data.
         pitcher_id (str): The ID of the pitcher.
         plot_picker (str): The type of plot to create ('short_form_movement', 'long_form_movement', 'release_point').
         sport_id (int): The sport ID to determine the plot title.
+        assets (dict): The header images and bio, or futures of them, as returned by header_assets or start_header_assets. Default is None, which fetches them.
+        timings (dict): An optional dict the seconds spent in each phase are written to. Default is None.
+        dpi (int): The resolution the figure is laid out at, see RENDER_QUALITY. Default is 400.
+
+        Returns:
+        matplotlib.figure.Figure: The finished figure.
         """
-        # Set the theme for seaborn plots
-        sns.set_theme(style="whitegrid", rc=self.sns_custom_theme()[0])
-        
-        # Create a figure and a gridspec with 6 rows and 5 columns
-        fig = plt.figure(figsize=(16, 16), dpi=400)
-        gs = gridspec.GridSpec(6, 5, figure=fig, height_ratios=[0.00000000005, 5, 30, 5, 2, 0.00000000005], width_ratios=[1, 10, 10, 10, 1])
+        timings = timings if timings is not None else {}
+        start = time.perf_counter()
+        if assets is None:
+            assets = self.start_header_assets(pitcher_id=pitcher_id, sport_id=sport_id, timings=timings)
 
-        # Create subplots for player headshot, bio, and logo
-        ax_headshot = fig.add_subplot(gs[1, 1])
-        ax_bio = fig.add_subplot(gs[1, 2])
-        ax_logo = fig.add_subplot(gs[1, 3])
+        # Copy the laid out scaffold of this plot type and pitcher hand
+        phase = time.perf_counter()
+        fig, axes = self.figure_template(plot_picker=plot_picker, pitcher_hand=df['pitcher_hand'][0], sport_id=sport_id, dpi=dpi)
+        timings['template'] = time.perf_counter() - phase
 
         # Get the start and end dates and unique batter hands from the DataFrame
         start_date = df['game_date'].min()
         end_date = df['game_date'].max()
         batter_hand = list(df['batter_hand'].unique())
 
-        # Plot player headshot, bio, and logo
-        self.player_headshot(pitcher_id=pitcher_id, ax=ax_headshot, sport_id=sport_id)
-        self.player_bio(pitcher_id=pitcher_id, ax=ax_bio, start_date=start_date, end_date=end_date, batter_hand=batter_hand)
-        self.plot_logo(pitcher_id=pitcher_id, ax=ax_logo)
+        # Summarise each pitch type once for the ellipses and the legend
+        summary = self.pitch_type_summary(df)
 
-        # Create subplot for the main plot
-        ax_main_plot = fig.add_subplot(gs[2, :])
+        # Plot the pitches of the selected plot
+        phase = time.perf_counter()
+        self.plot_pitches(df, axes['main_plot'], plot_picker=plot_picker, summary=summary)
+        timings['main_plot'] = time.perf_counter() - phase
 
-        # Create subplot for the legend
-        ax_legend = fig.add_subplot(gs[3, :])
-        ax_legend.axis('off')
-
-        # Create subplot for the footer
-        ax_footer = fig.add_subplot(gs[-2, :])
-
-        # Plot the selected pitch movement plot
-        if plot_picker == 'short_form_movement':
-            self.break_plot_big(df, ax_main_plot, sport_id=sport_id)
-        elif plot_picker == 'long_form_movement':
-            self.break_plot_big_long(df, ax_main_plot, sport_id=sport_id)
-        elif plot_picker == 'release_point':
-            self.release_point_plot(df, ax_main_plot, sport_id=sport_id)
-
-        # Sort the DataFrame and get unique pitch types
-        items_in_order = list(df.sort(by=['prop', 'pitch_type'], descending=[True, True])['pitch_type'].unique(maintain_order=True))
+        # Order the pitch types by usage from the summary table
+        phase = time.perf_counter()
+        items_in_order = summary.sort(by=['prop', 'pitch_type'], descending=[True, True])['pitch_type'].to_list()
 
         # Get pitch colors and names
         dict_colour, dict_pitch = self.pitch_colours()
@@ -591,32 +1096,99 @@ class PitchPlotFunctions:
         legend_handles = [mlines.Line2D([], [], color=color, marker='o', linestyle='None', markersize=8, label=label) for color, label in zip(ordered_colors, items_in_order)]
 
         # Add legend to ax_legend
-        ax_legend.legend(handles=legend_handles, bbox_to_anchor=(0.1, 0, 0.8, 0.5), ncol=5, fancybox=True, loc='lower center', fontsize=8, framealpha=1.0, markerscale=2, prop={'size': 16})
+        axes['legend'].legend(handles=legend_handles, bbox_to_anchor=(0.1, 0, 0.8, 0.5), ncol=5, fancybox=True, loc='lower center', fontsize=8, framealpha=1.0, markerscale=2, prop={'size': 16})
+        timings['legend'] = time.perf_counter() - phase
 
-        # Add footer text
-        ax_footer.text(x=0.075, y=1, s='By: Thomas Nestico\n      @TJStats', fontname='Calibri', ha='left', fontsize=24, va='top')
-        ax_footer.text(x=1-0.075, y=1, s='Data: MLB', ha='right', fontname='Calibri', fontsize=24, va='top')
-        ax_footer.axis('off')
+        # Wait for the header assets, then plot player headshot, bio, and logo
+        phase = time.perf_counter()
+        assets = {k: v.result() if isinstance(v, Future) else v for k, v in assets.items()}
+        timings['assets_wait'] = time.perf_counter() - phase
 
-        # Create subplots for the borders
-        ax_top_border = fig.add_subplot(gs[0, :])
-        ax_left_border = fig.add_subplot(gs[:, 0])
-        ax_right_border = fig.add_subplot(gs[:, -1])
-        ax_bottom_border = fig.add_subplot(gs[-1, :])
+        phase = time.perf_counter()
+        self.player_headshot(pitcher_id=pitcher_id, ax=axes['headshot'], sport_id=sport_id, img=assets['headshot'])
+        self.player_bio(pitcher_id=pitcher_id, ax=axes['bio'], start_date=start_date, end_date=end_date, batter_hand=batter_hand, player=assets['player'])
+        self.plot_logo(pitcher_id=pitcher_id, ax=axes['logo'], img=assets['logo'])
+        timings['header'] = time.perf_counter() - phase
+        timings['total'] = time.perf_counter() - start
 
-        # Turn off the axes for the border subplots
-        ax_top_border.axis('off')
-        ax_left_border.axis('off')
-        ax_right_border.axis('off')
-        ax_bottom_border.axis('off')
+        return fig
 
-        # Adjust layout and show the figure
-        fig.tight_layout()
-        fig.subplots_adjust(hspace=0.1, wspace=0.1)
-        st.pyplot(fig)
+    def final_plot(self, df: pl.DataFrame, pitcher_id: str, plot_picker: str, sport_id: int, assets: dict = None, quality: str = 'screen', progressive: bool = False):
+        """
+        Creates the final plot and shows it in the app.
 
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data.
+        pitcher_id (str): The ID of the pitcher.
+        plot_picker (str): The type of plot to create ('short_form_movement', 'long_form_movement', 'release_point').
+        sport_id (int): The sport ID to determine the plot title.
+        assets (dict): The header images and bio as returned by header_assets. Default is None, which fetches them.
+        quality (str): The render quality tier, one of RENDER_QUALITY. Default is 'screen'.
+        progressive (bool): Whether to show a preview first and replace it once the requested quality is rendered. Default is False.
+        """
+        placeholder = st.empty()
+        if progressive and quality != 'preview':
+            placeholder.image(self.render_png(df=df, pitcher_id=pitcher_id, plot_picker=plot_picker, sport_id=sport_id, assets=assets, quality='preview'),
+                              use_column_width=True)
+        png = self.render_png(df=df, pitcher_id=pitcher_id, plot_picker=plot_picker, sport_id=sport_id, assets=assets, quality=quality)
+        placeholder.image(png, use_column_width=True)
 
+    def render_png(self, df: pl.DataFrame, pitcher_id: str, plot_picker: str, sport_id: int, assets: dict = None, timings: dict = None, quality: str = 'screen'):
+        """
+        Renders the final plot to PNG bytes, serving a cached copy when the same plot of the same data was rendered before.
 
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data.
+        pitcher_id (str): The ID of the pitcher.
+        plot_picker (str): The type of plot to create ('short_form_movement', 'long_form_movement', 'release_point').
+        sport_id (int): The sport ID to determine the plot title.
+        assets (dict): The header images and bio, or futures of them, as returned by header_assets or start_header_assets. Default is None, which fetches them.
+        timings (dict): An optional dict the seconds spent in each phase are written to, only filled when the plot is rendered. Default is None.
+        quality (str): The render quality tier, one of RENDER_QUALITY. 'screen' matches what st.pyplot shows. Default is 'screen'.
 
-    
+        Returns:
+        bytes: The plot as a PNG.
+        """
+        if quality not in RENDER_QUALITY:
+            raise ValueError(f"quality must be one of {list(RENDER_QUALITY)}")
+        dpi = RENDER_QUALITY[quality]
+
+        # The date range and batter hands shown in the header come from the data, so the content hash covers the filters
+        key = self.figure_cache.fingerprint(df, str(pitcher_id), sport_id, plot_picker, quality)
+        png = self.figure_cache.get(key)
+        if png is not None:
+            return png
+
+        png = self._render_pool.submit(self.render_figure, df=df, pitcher_id=pitcher_id, plot_picker=plot_picker, sport_id=sport_id,
+                                       assets=assets, timings=timings, dpi=dpi).result()
+        self.figure_cache.put(key, png)
+        return png
+
+    def render_figure(self, df: pl.DataFrame, pitcher_id: str, plot_picker: str, sport_id: int, assets: dict = None, timings: dict = None, dpi: int = 200):
+        """
+        Builds the final plot and encodes it to PNG bytes, clearing the figure afterwards. render_png runs it on the render pool.
 
+        Parameters:
+        df (pl.DataFrame): The DataFrame containing pitch data.
+        pitcher_id (str): The ID of the pitcher.
+        plot_picker (str): The type of plot to create ('short_form_movement', 'long_form_movement', 'release_point').
+        sport_id (int): The sport ID to determine the plot title.
+        assets (dict): The header images and bio, or futures of them, as returned by header_assets or start_header_assets. Default is None, which fetches them.
+        timings (dict): An optional dict the seconds spent in each phase are written to. Default is None.
+        dpi (int): The resolution the figure is laid out and encoded at, see RENDER_QUALITY. Default is 200.
+
+        Returns:
+        bytes: The plot as a PNG.
+        """
+        # Lay the figure out at the output resolution, so no raster larger than the PNG is allocated
+        fig = self.build_plot(df=df, pitcher_id=pitcher_id, plot_picker=plot_picker, sport_id=sport_id, assets=assets, timings=timings, dpi=dpi)
+        try:
+            buf = BytesIO()
+            start = time.perf_counter()
+            fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
+            if timings is not None:
+                timings['encode'] = time.perf_counter() - start
+        finally:
+            # Drop the artists now rather than whenever the figure is garbage collected
+            fig.clear()
+        return buf.getvalue()
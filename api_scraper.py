@@ -1,17 +1,580 @@
 import requests
 import polars as pl
 import numpy as np
-from datetime import datetime
+from datetime import datetime, date, timedelta
 from tqdm import tqdm
 from pytz import timezone
 import re
+import os
+import gzip
+import json
+import time
+import threading
+import glob
+import weakref
+import copy
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Per-game frames share one string cache so their Categorical columns concatenate without re-encoding.
+# This is process-wide: importing this module turns on Polars' global string cache for every caller, and it is never turned off.
+# It cannot be scoped with pl.StringCache(): the frames held by SharedPitchStore, PitchDataCache and the live-game state
+# are concatenated long after the call that built them, and frames built under different string caches raise
+# StringCacheMismatchError when they are concatenated.
+pl.enable_string_cache()
+
+# Schema of the pitch DataFrame built by MLB_Scrape.get_data_df, in column order
+PITCH_SCHEMA = {
+    'game_id': pl.Int32,
+    'game_date': pl.Date,
+    'batter_id': pl.Int32,
+    'batter_name': pl.String,
+    'batter_hand': pl.Categorical('lexical'),
+    'batter_team': pl.Categorical('lexical'),
+    'batter_team_id': pl.Int32,
+    'pitcher_id': pl.Int32,
+    'pitcher_name': pl.String,
+    'pitcher_hand': pl.Categorical('lexical'),
+    'pitcher_team': pl.Categorical('lexical'),
+    'pitcher_team_id': pl.Int32,
+    'ab_number': pl.Int16,
+    'play_description': pl.String,
+    'play_code': pl.Categorical('lexical'),
+    'in_play': pl.Boolean,
+    'is_strike': pl.Boolean,
+    'is_swing': pl.Boolean,
+    'is_whiff': pl.Boolean,
+    'is_out': pl.Boolean,
+    'is_ball': pl.Boolean,
+    'is_review': pl.Boolean,
+    'pitch_type': pl.Categorical('lexical'),
+    'pitch_description': pl.Categorical('lexical'),
+    'strikes': pl.Int8,
+    'balls': pl.Int8,
+    'outs': pl.Int8,
+    'strikes_after': pl.Int8,
+    'balls_after': pl.Int8,
+    'outs_after': pl.Int8,
+    'start_speed': pl.Float32,
+    'end_speed': pl.Float32,
+    'sz_top': pl.Float32,
+    'sz_bot': pl.Float32,
+    'x': pl.Float32,
+    'y': pl.Float32,
+    'ax': pl.Float32,
+    'ay': pl.Float32,
+    'az': pl.Float32,
+    'pfxx': pl.Float32,
+    'pfxz': pl.Float32,
+    'px': pl.Float32,
+    'pz': pl.Float32,
+    'vx0': pl.Float32,
+    'vy0': pl.Float32,
+    'vz0': pl.Float32,
+    'x0': pl.Float32,
+    'y0': pl.Float32,
+    'z0': pl.Float32,
+    'zone': pl.Int8,
+    'type_confidence': pl.Float32,
+    'plate_time': pl.Float32,
+    'extension': pl.Float32,
+    'spin_rate': pl.Float32,
+    'spin_direction': pl.Float32,
+    'vb': pl.Float32,
+    'ivb': pl.Float32,
+    'hb': pl.Float32,
+    'launch_speed': pl.Float32,
+    'launch_angle': pl.Float32,
+    'launch_distance': pl.Float32,
+    'launch_location': pl.Categorical('lexical'),
+    'trajectory': pl.Categorical('lexical'),
+    'hardness': pl.Categorical('lexical'),
+    'hit_x': pl.Float32,
+    'hit_y': pl.Float32,
+    'index_play': pl.Int16,
+    'play_id': pl.String,
+    'start_time': pl.String,
+    'end_time': pl.String,
+    'is_pitch': pl.Boolean,
+    'type_type': pl.Categorical('lexical'),
+    'type_ab': pl.Categorical('lexical'),
+    'event': pl.Categorical('lexical'),
+    'event_type': pl.Categorical('lexical'),
+    'rbi': pl.Int8,
+    'away_score': pl.Int16,
+    'home_score': pl.Int16,
+}
+PITCH_COLUMNS = list(PITCH_SCHEMA)
+# The Categorical columns, whose lexical ordering is lost when they are written to Parquet
+PITCH_CATEGORICALS = {k: v for k, v in PITCH_SCHEMA.items() if isinstance(v, pl.Categorical)}
+
+
+class FeedStore:
+
+    def __init__(self, path: str = 'feed_cache', max_bytes: int = 2 * 1024 ** 3, live_ttl: int = 30):
+        """
+        Disk-backed store of game feeds, gzip compressed and keyed by game ID.
 
+        Parameters:
+        - path (str): The directory the feeds are written to. Default is 'feed_cache'.
+        - max_bytes (int): The maximum size of the store on disk. Least recently used feeds are evicted beyond it. Default is 2 GB.
+        - live_ttl (int): Seconds a feed for a game that is not Final is served from disk. 0 bypasses the store for those games. Default is 30.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.path, exist_ok=True)
+        self._size = sum(os.path.getsize(f) for f in self._files())
+
+    def _files(self):
+        # List the feed files currently held in the store
+        return [os.path.join(self.path, f) for f in os.listdir(self.path) if f.endswith('.json.gz')]
+
+    def _file(self, game_id: int, final: bool):
+        # Finished and unfinished feeds are kept in separate files so freshness can be told from the name
+        return os.path.join(self.path, f"{game_id}.{'final' if final else 'live'}.json.gz")
+
+    def get(self, game_id: int):
+        """
+        Retrieves a stored feed for a game ID.
 
-class MLB_Scrape:
+        Parameters:
+        - game_id (int): The game ID to look up.
+
+        Returns:
+        - data (dict): The stored feed, or None if the game is not stored or its live feed has expired.
+        """
+        final_file = self._file(game_id, final=True)
+        live_file = self._file(game_id, final=False)
+        try:
+            if os.path.exists(final_file):
+                # Touch the file so eviction treats it as recently used
+                os.utime(final_file)
+                path = final_file
+            elif os.path.exists(live_file) and time.time() - os.path.getmtime(live_file) < self.live_ttl:
+                path = live_file
+            else:
+                path = None
+
+            if path is not None:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    data = json.load(f)
+                with self._lock:
+                    self.hits += 1
+                return data
+        except (OSError, ValueError):
+            # A file evicted or half-written by another worker counts as a miss
+            pass
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, data: dict):
+        """
+        Writes a feed to the store. Feeds for games that are not Final are only written when live_ttl is positive.
+
+        Parameters:
+        - data (dict): The feed to store.
+        """
+        final = data['gameData']['status']['abstractGameState'] == 'Final'
+        if not final and self.live_ttl <= 0:
+            return
+
+        path = self._file(data['gamePk'], final=final)
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        with self._lock:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            self._size += os.path.getsize(path) - old_size
+
+            # A finished feed supersedes any live copy of the same game
+            live_file = self._file(data['gamePk'], final=False)
+            if final and os.path.exists(live_file):
+                self._size -= os.path.getsize(live_file)
+                os.remove(live_file)
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Remove the least recently used feeds until the store fits within max_bytes
+        files = sorted(self._files(), key=os.path.getmtime)
+        for f in files:
+            if self._size <= self.max_bytes:
+                break
+            self._size -= os.path.getsize(f)
+            os.remove(f)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Reports the store's counters.
+
+        Returns:
+        - stats (dict): The number of hits, misses, evictions, stored feeds, and bytes on disk.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'feeds': len(self._files()),
+                    'bytes': self._size}
+
+
+class PitchStore:
+
+    def __init__(self, path: str = 'pitch_store'):
+        """
+        Parquet dataset of flattened pitch data, partitioned by season, sport_id and game_date with one file per game.
+
+        Parameters:
+        - path (str): The root directory of the dataset. Default is 'pitch_store'.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def _game_files(self, game_id: int):
+        # Find every file a game is stored in, whatever partition it was written to
+        return glob.glob(os.path.join(self.path, '*', '*', '*', f'{game_id}.parquet'))
+
+    def game_files(self):
+        """
+        Lists the file of each game held in the store. Only the directories are read, no file is opened.
+
+        Returns:
+        - game_files (dict): The path of each stored game's file, keyed by game ID.
+        """
+        files = glob.glob(os.path.join(self.path, '*', '*', '*', '*.parquet'))
+        return {int(os.path.basename(f).split('.')[0]): f for f in files}
+
+    def game_ids(self):
+        """
+        Lists the games held in the store.
+
+        Returns:
+        - game_ids (set): The game IDs that have been written to the store.
+        """
+        return set(self.game_files())
+
+    def read(self, game_ids: list, game_files: dict = None):
+        """
+        Reads the pitch data of the given games, opening only their files.
+
+        Parameters:
+        - game_ids (list): The game IDs to read. Games that are not in the store are left out.
+        - game_files (dict): The store's files as returned by game_files, to save listing it again. Default is None, which lists it.
+
+        Returns:
+        - df (pl.DataFrame): A DataFrame with the same columns and schema as MLB_Scrape.get_data_df.
+        """
+        game_files = game_files if game_files is not None else self.game_files()
+        paths = [game_files[game_id] for game_id in game_ids if game_id in game_files]
+        if len(paths) == 0:
+            return pl.DataFrame(schema=PITCH_SCHEMA)
+
+        lf = pl.scan_parquet(paths,
+                             hive_partitioning=True,
+                             hive_schema={'season': pl.Int32, 'sport_id': pl.Int32, 'game_date': pl.Date})
+        return lf.select(PITCH_COLUMNS).collect().cast(PITCH_CATEGORICALS)
+
+    def upsert(self, df: pl.DataFrame, sport_id: int):
+        """
+        Writes the pitch data for each game in a DataFrame, replacing anything already stored for those games.
+
+        Parameters:
+        - df (pl.DataFrame): A DataFrame of pitch data as returned by MLB_Scrape.get_data_df.
+        - sport_id (int): The sport ID the games were played in.
+        """
+        for (game_id, game_date), game_df in df.partition_by(['game_id', 'game_date'], as_dict=True).items():
+            partition = os.path.join(self.path, f'season={game_date.year}', f'sport_id={sport_id}', f'game_date={game_date}')
+            os.makedirs(partition, exist_ok=True)
+            path = os.path.join(partition, f'{game_id}.parquet')
+
+            # game_date is carried by the partition path rather than the file
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            game_df.drop('game_date').write_parquet(tmp_path, statistics=True)
+
+            with self._lock:
+                # A game moved to another date (e.g. a postponement) leaves its old copy behind otherwise
+                for f in self._game_files(game_id):
+                    if f != path:
+                        os.remove(f)
+                os.replace(tmp_path, path)
+
+    def scan(self):
+        """
+        Lazily scans the store so filters on game_date, pitcher_id and other columns are pushed down to the files.
+        The Categorical columns are left in physical ordering, since casting them in the plan would keep every filter above the scan.
+        Cast them to PITCH_CATEGORICALS after collecting where the lexical ordering matters.
+
+        Returns:
+        - lf (pl.LazyFrame): A LazyFrame with the same columns as MLB_Scrape.get_data_df.
+        """
+        if len(glob.glob(os.path.join(self.path, '*', '*', '*', '*.parquet'))) == 0:
+            return pl.LazyFrame(schema=PITCH_SCHEMA)
+
+        lf = pl.scan_parquet(os.path.join(self.path, '**', '*.parquet'),
+                             hive_partitioning=True,
+                             hive_schema={'season': pl.Int32, 'sport_id': pl.Int32, 'game_date': pl.Date})
+        return lf.select(PITCH_COLUMNS)
+
+
+class PlayerDirectory:
+
+    def __init__(self, path: str = 'player_cache', ttl: int = 6 * 3600):
+        """
+        Cache of league rosters kept in memory and on disk, with the pitcher subset and name to ID mapping built once per refresh.
+
+        Parameters:
+        - path (str): The directory the rosters are written to. None keeps them in memory only. Default is 'player_cache'.
+        - ttl (int): Seconds a roster is used before it is revalidated against the API. Default is 6 hours.
+        """
+        self.path = path
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+
+    def _file(self, sport_id: int):
+        # Each league's roster is kept in its own file, the download time is the file's mtime
+        return os.path.join(self.path, f'{sport_id}.json.gz')
+
+    def _build(self, people: list, etag: str, last_modified: str, fetched: float):
+        # Build the roster frame, its pitcher subset and the selectbox mapping once per download
+        player_df = players_df(people)
+        pitcher_df = player_df.filter(pl.col('position').str.contains('P')).with_columns(
+            pl.concat_str(['name', 'player_id'], separator=' - ').alias('pitcher_name_id'))
+        return {'people': people,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched': fetched,
+                'player_df': player_df,
+                'pitcher_df': pitcher_df,
+                'pitcher_name_id_dict': dict(pitcher_df.select(['pitcher_name_id', 'player_id']).iter_rows())}
+
+    def get(self, sport_id: int):
+        """
+        Retrieves the cached roster of a league, loading it from disk if it is not in memory.
+
+        Parameters:
+        - sport_id (int): The sport ID of the league.
+
+        Returns:
+        - entry (dict): The raw people, validators, fetch time, player_df, pitcher_df and pitcher_name_id_dict, or None if the league is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(sport_id)
+        if entry is not None or self.path is None:
+            return entry
+
+        try:
+            with gzip.open(self._file(sport_id), 'rt', encoding='utf-8') as f:
+                stored = json.load(f)
+            fetched = os.path.getmtime(self._file(sport_id))
+        except (OSError, ValueError):
+            return None
+
+        entry = self._build(stored['people'], stored['etag'], stored['last_modified'], fetched)
+        with self._lock:
+            self._entries[sport_id] = entry
+        return entry
+
+    def is_fresh(self, entry: dict):
+        """
+        Checks whether a cached roster is younger than the TTL.
+
+        Parameters:
+        - entry (dict): An entry returned by get.
+
+        Returns:
+        - fresh (bool): True if the roster can be used without revalidating it.
+        """
+        return time.time() - entry['fetched'] < self.ttl
+
+    def put(self, sport_id: int, people: list, etag: str = None, last_modified: str = None):
+        """
+        Stores a freshly downloaded roster.
+
+        Parameters:
+        - sport_id (int): The sport ID of the league.
+        - people (list): The people list of the /sports/{sport_id}/players response.
+        - etag (str): The ETag header of the response. Default is None.
+        - last_modified (str): The Last-Modified header of the response. Default is None.
+
+        Returns:
+        - entry (dict): The new entry, as returned by get.
+        """
+        entry = self._build(people, etag, last_modified, time.time())
+        with self._lock:
+            self._entries[sport_id] = entry
+
+        if self.path is not None:
+            path = self._file(sport_id)
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump({'people': people, 'etag': etag, 'last_modified': last_modified}, f)
+            os.replace(tmp_path, path)
+        return entry
+
+    def touch(self, sport_id: int):
+        """
+        Restarts the TTL of a cached roster the API reported as unchanged.
+
+        Parameters:
+        - sport_id (int): The sport ID of the league.
+        """
+        with self._lock:
+            entry = self._entries.get(sport_id)
+            if entry is not None:
+                entry['fetched'] = time.time()
+        if self.path is not None and os.path.exists(self._file(sport_id)):
+            os.utime(self._file(sport_id))
+
+
+def players_df(people: list):
+    """
+    Converts the people list of a /sports/{sport_id}/players response into a Polars DataFrame.
+
+    Parameters:
+    - people (list): The people returned by the API.
+
+    Returns:
+    - player_df (pl.DataFrame): A DataFrame containing player information, including player ID, name, position, team, and age.
+    """
+    #Select relevant data that will help distinguish players from one another
+    fullName_list = [x['fullName'] for x in people]
+    firstName_list = [x['firstName'] for x in people]
+    lastName_list = [x['lastName'] for x in people]
+    id_list = [x['id'] for x in people]
+    position_list = [x['primaryPosition']['abbreviation'] for x in people]
+    team_list = [x['currentTeam']['id']for x in people]
+    weight_list = [x['weight'] for x in people]
+    height_list = [x['height'] for x in people]
+    age_list = [x['currentAge']for x in people]
+    birthDate_list = [x['birthDate']for x in people]
+
+    df = pl.DataFrame(data={'player_id':id_list,
+                            'first_name':firstName_list,
+                            'last_name':lastName_list,
+                            'name':fullName_list,
+                            'position':position_list,
+                            'team':team_list,
+                            'weight':weight_list,
+                            'height':height_list,
+                            'age':age_list,
+                            'birthDate':birthDate_list})
+
+    return df
+
+
+class SingleFlight:
 
     def __init__(self):
-        # Initialize your class here if needed
-        pass
+        """
+        Coalesces concurrent calls for the same key, so only the first caller does the work and the others wait for and share its result.
+        """
+        self.calls = 0
+        self.shared = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        Runs fn unless a call for the same key is already in flight, in which case its result is waited for instead.
+
+        Parameters:
+        - key (hashable): Identifies the work, e.g. a URL or a game ID.
+        - fn (callable): The function doing the work, called without arguments.
+
+        Returns:
+        - result: The value returned by fn. An exception raised by fn is raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = {'done': threading.Event(), 'result': None, 'error': None}
+                self._in_flight[key] = call
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = fn()
+        except BaseException as e:
+            call['error'] = e
+            raise
+        finally:
+            # Later callers start a new call rather than reuse this result
+            with self._lock:
+                del self._in_flight[key]
+            call['done'].set()
+        return call['result']
+
+
+class MLB_Scrape:
+
+    def __init__(self, feed_store: FeedStore = None, pitch_store: PitchStore = None, player_directory: PlayerDirectory = None, session: requests.Session = None, pool_size: int = 16, timeout: float = 30):
+        """
+        Parameters:
+        - feed_store (FeedStore): An optional disk store that feeds are served from and written to. Default is None.
+        - pitch_store (PitchStore): An optional Parquet store that get_pitch_data reads finished games from and writes them to. Default is None.
+        - player_directory (PlayerDirectory): The roster cache get_players reads from. Default is an in-memory PlayerDirectory.
+        - session (requests.Session): An optional session to send every request through. Default is a new pooled session.
+        - pool_size (int): The number of keep-alive connections kept per host by the default session. Default is 16.
+        - timeout (float): Seconds to wait on each request before giving up. Default is 30.
+        """
+        self.feed_store = feed_store
+        self.pitch_store = pitch_store
+        self.player_directory = player_directory if player_directory is not None else PlayerDirectory(path=None)
+        self.timeout = timeout
+
+        if session is None:
+            # Reuse connections across requests instead of paying a TCP and TLS handshake on each one
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+        self.session = session
+
+        # Feed and parsed pitch data of games in progress followed with get_live_data_df, keyed by game ID, least recently updated first
+        self._live_games = OrderedDict()
+        self.live_ttl = 3600
+        self.max_live_games = 64
+        # Game IDs whose feed has been seen in the Final state
+        self._final_games = set()
+        # Concurrent downloads of the same feed or roster share one request
+        self._flight = SingleFlight()
+        # Player bio and current team records with their download time, keyed by player ID, see get_player_metadata
+        self._player_metadata = {}
+        self.metadata_ttl = 3600
+        self._lock = threading.Lock()
+        # Teams keyed by team ID, see get_team_directory
+        self._team_directory = None
+        self.team_ttl = 24 * 3600
+        # Parsed schedules and their date and team indexes, keyed by the get_schedule parameters
+        self._schedule_cache = {}
+        self.schedule_ttl = 900
 
     def get_sport_id(self):
         """
@@ -21,7 +584,7 @@ class MLB_Scrape:
         - df (pl.DataFrame): A DataFrame containing the sports information.
         """
         # Make API call to retrieve sports information
-        response = requests.get(url='https://statsapi.mlb.com/api/v1/sports').json()
+        response = self.session.get(url='https://statsapi.mlb.com/api/v1/sports', timeout=self.timeout).json()
         
         # Convert the JSON response into a Polars DataFrame
         df = pl.DataFrame(response['sports'])
@@ -58,7 +621,7 @@ class MLB_Scrape:
         - df (pl.DataFrame): A DataFrame containing the game types information.
         """
         # Make API call to retrieve game types information
-        response = requests.get(url='https://statsapi.mlb.com/api/v1/gameTypes').json()
+        response = self.session.get(url='https://statsapi.mlb.com/api/v1/gameTypes', timeout=self.timeout).json()
         
         # Convert the JSON response into a Polars DataFrame
         df = pl.DataFrame(response)
@@ -68,16 +631,21 @@ class MLB_Scrape:
     def get_schedule(self,
                     year_input: list = [2024],
                     sport_id: list = [1],
-                    game_type: list = ['R']):
+                    game_type: list = ['R'],
+                    hydrate: list = [],
+                    refresh: bool = False):
         
         """
         Retrieves the schedule of baseball games based on the specified parameters.
+        The parsed schedule is cached for schedule_ttl seconds per set of parameters.
         Parameters:
         - year_input (list): A list of years to filter the schedule. Default is [2024].
         - sport_id (list): A list of sport IDs to filter the schedule. Default is [1].
         - game_type (list): A list of game types to filter the schedule. Default is ['R'].
+        - hydrate (list): A list of hydrations to request (e.g. ['lineup', 'players']). None of them are used by the returned columns. Default is [].
+        - refresh (bool): Whether to download the schedule again even if a cached copy is fresh. Default is False.
         Returns:
-        - game_df (pandas.DataFrame): A DataFrame containing the game schedule information, including game ID, date, time, away team, home team, game state, venue ID, and venue name. If the schedule length is 0, it returns a message indicating that different parameters should be selected.
+        - game_df (pl.DataFrame): A DataFrame containing the game schedule information, including game ID, date, time, away team, home team, game state, venue ID, and venue name. If the schedule length is 0, it returns a message indicating that different parameters should be selected.
         """
 
         # Type checks
@@ -88,6 +656,14 @@ class MLB_Scrape:
 
         if not isinstance(game_type, list) or not all(isinstance(gt, str) for gt in game_type):
             raise ValueError("game_type must be a list of strings.")
+        if not isinstance(hydrate, list) or not all(isinstance(h, str) for h in hydrate):
+            raise ValueError("hydrate must be a list of strings.")
+
+        # Serve the schedule from the cache while it is fresh
+        key = (tuple(year_input), tuple(sport_id), tuple(game_type), tuple(hydrate))
+        cached = self._schedule_cache.get(key)
+        if cached is not None and not refresh and time.time() - cached['time'] < self.schedule_ttl:
+            return cached['game_df']
 
         eastern = timezone('US/Eastern')
 
@@ -95,33 +671,29 @@ class MLB_Scrape:
         year_input_str = ','.join([str(x) for x in year_input])
         sport_id_str = ','.join([str(x) for x in sport_id])
         game_type_str = ','.join([str(x) for x in game_type])
+        hydrate_str = f"&hydrate={','.join(hydrate)}" if hydrate else ''
 
         # Make API call to retrieve game schedule
-        game_call = requests.get(url=f'https://statsapi.mlb.com/api/v1/schedule/?sportId={sport_id_str}&gameTypes={game_type_str}&season={year_input_str}&hydrate=lineup,players').json()
-
-        # Extract relevant data from the API response
-        game_list = [item for sublist in [[y['gamePk'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        time_list = [item for sublist in [[y['gameDate'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        date_list = [item for sublist in [[y['officialDate'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        away_team_list = [item for sublist in [[y['teams']['away']['team']['name'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        home_team_list = [item for sublist in [[y['teams']['home']['team']['name'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        state_list = [item for sublist in [[y['status']['codedGameState'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        venue_id = [item for sublist in [[y['venue']['id'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        venue_name = [item for sublist in [[y['venue']['name'] for y in x['games']] for x in game_call['dates']] for item in sublist]
+        game_call = self.session.get(url=f'https://statsapi.mlb.com/api/v1/schedule/?sportId={sport_id_str}&gameTypes={game_type_str}&season={year_input_str}{hydrate_str}', timeout=self.timeout).json()
+
+        # Extract relevant data from the API response in a single pass over every game
+        game_rows = [(y['gamePk'],
+                      y['gameDate'],
+                      y['officialDate'],
+                      y['teams']['away']['team']['name'],
+                      y['teams']['home']['team']['name'],
+                      y['status']['codedGameState'],
+                      y['venue']['id'],
+                      y['venue']['name']) for x in game_call['dates'] for y in x['games']]
+
+        # Check if the schedule is empty
+        if len(game_rows) == 0:
+            return 'Schedule Length of 0, please select different parameters.'
 
         # Create a Polars DataFrame with the extracted data
-        game_df = pl.DataFrame(data={'game_id': game_list,
-                                    'time': time_list,
-                                    'date': date_list,
-                                    'away': away_team_list,
-                                    'home': home_team_list,
-                                    'state': state_list,
-                                    'venue_id': venue_id,
-                                    'venue_name': venue_name})
-
-        # Check if the DataFrame is empty
-        if len(game_df) == 0:
-            return 'Schedule Length of 0, please select different parameters.'
+        game_df = pl.DataFrame(data=game_rows,
+                               schema=['game_id', 'time', 'date', 'away', 'home', 'state', 'venue_id', 'venue_name'],
+                               orient='row')
 
         # Convert date and time columns to appropriate formats
         game_df = game_df.with_columns(
@@ -135,610 +707,641 @@ class MLB_Scrape:
         if len(game_df) == 0:
             return 'Schedule Length of 0, please select different parameters.'
 
+        # Index the schedule by date and by team so lookups do not rescan it
+        by_date = {k[0]: v for k, v in game_df.partition_by('date', as_dict=True).items()}
+        by_team = {}
+        for side in ['away', 'home']:
+            for (team,), team_df in game_df.partition_by(side, as_dict=True).items():
+                by_team[team] = pl.concat([by_team[team], team_df]).sort('date') if team in by_team else team_df
+
+        self._schedule_cache[key] = {'time': time.time(), 'game_df': game_df, 'by_date': by_date, 'by_team': by_team}
+
         return game_df
-    
 
-    def get_data(self, game_list_input: list):
+    def _schedule_index(self, index: str, year_input: list, sport_id: list, game_type: list):
+        # Make sure the schedule is loaded, then hand back one of its indexes
+        game_df = self.get_schedule(year_input=year_input, sport_id=sport_id, game_type=game_type)
+        if isinstance(game_df, str):
+            return None, {}
+        return game_df, self._schedule_cache[(tuple(year_input), tuple(sport_id), tuple(game_type), ())][index]
+
+    def get_games_on_date(self, game_date, sport_id: list = [1], game_type: list = ['R']):
+        """
+        Retrieves the games scheduled on a date from the cached, date-indexed schedule.
+
+        Parameters:
+        - game_date (str | datetime.date): The date (YYYY-MM-DD) to look up.
+        - sport_id (list): A list of sport IDs to filter the schedule. Default is [1].
+        - game_type (list): A list of game types to filter the schedule. Default is ['R'].
+
+        Returns:
+        - game_df (pl.DataFrame): The schedule rows for the date, empty if there are none.
+        """
+        if isinstance(game_date, str):
+            game_date = date.fromisoformat(game_date)
+        game_df, by_date = self._schedule_index('by_date', [game_date.year], sport_id, game_type)
+        if game_df is None:
+            return pl.DataFrame()
+        return by_date.get(game_date, game_df.clear())
+
+    def get_games_for_team(self, team: str, season: int, sport_id: list = [1], game_type: list = ['R']):
+        """
+        Retrieves the games a team plays in a season from the cached, team-indexed schedule.
+
+        Parameters:
+        - team (str): The team name as it appears in the schedule's away and home columns.
+        - season (int): The season to look up.
+        - sport_id (list): A list of sport IDs to filter the schedule. Default is [1].
+        - game_type (list): A list of game types to filter the schedule. Default is ['R'].
+
+        Returns:
+        - game_df (pl.DataFrame): The schedule rows for the team sorted by date, empty if there are none.
+        """
+        game_df, by_team = self._schedule_index('by_team', [season], sport_id, game_type)
+        if game_df is None:
+            return pl.DataFrame()
+        return by_team.get(team, game_df.clear())
+
+    def get_game_feed(self, game_id: int):
+        """
+        Retrieves the live feed for a single game ID. Concurrent calls for the same game share one download and the parsed feed, which must not be modified.
+
+        Parameters:
+        - game_id (int): The game ID for which to retrieve live data.
+
+        Returns:
+        - data (dict): The JSON response containing live game data for the game ID.
+        """
+        return self._flight.do(('feed', game_id), lambda: self._get_game_feed(game_id))
+
+    def _get_game_feed(self, game_id: int):
+        # Serve the feed from the disk store when it holds a usable copy
+        data = self.feed_store.get(game_id) if self.feed_store is not None else None
+
+        if data is None:
+            # Make a GET request to the MLB API for the game ID
+            r = self.session.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live', timeout=self.timeout)
+            r.raise_for_status()
+            data = r.json()
+
+            if self.feed_store is not None:
+                self.feed_store.put(data)
+
+        if data['gameData']['status']['abstractGameState'] == 'Final':
+            self._final_games.add(game_id)
+
+        return data
+
+    def get_data(self, game_list_input: list, max_workers: int = 8, failed_games: dict = None):
         """
         Retrieves live game data for a list of game IDs.
-        
+
         Parameters:
         - game_list_input (list): A list of game IDs for which to retrieve live data.
-        
+        - max_workers (int): The maximum number of feeds downloaded concurrently. Default is 8, 1 downloads serially.
+        - failed_games (dict): An optional dict the error of each game that could not be retrieved is written to, keyed by game ID. Default is None.
+
         Returns:
-        - data_total (list): A list of JSON responses containing live game data for each game ID.
+        - data_total (list): A list of JSON responses containing live game data for each game ID, in input order.
+          Games that could not be retrieved are left out.
         """
-        data_total = []
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+
+        data_total = [None] * len(game_list_input)
+        failed_games = failed_games if failed_games is not None else {}
         print('This May Take a While. Progress Bar shows Completion of Data Retrieval.')
-        
-        # Iterate over the list of game IDs with a progress bar
-        for i in tqdm(range(len(game_list_input)), desc="Processing", unit="iteration"):
-            # Make a GET request to the MLB API for each game ID
-            r = requests.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_list_input[i]}/feed/live')
-            # Append the JSON response to the data_total list
-            data_total.append(r.json())
-        
-        return data_total
+
+        # Download the feeds with a bounded pool of workers, keeping track of each game's position
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.get_game_feed, game_id): i for i, game_id in enumerate(game_list_input)}
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Processing", unit="iteration"):
+                i = futures[future]
+                try:
+                    data_total[i] = future.result()
+                except (requests.RequestException, ValueError) as e:
+                    # Record the failure for this game and carry on with the rest of the batch
+                    failed_games[game_list_input[i]] = str(e)
+
+        if failed_games:
+            print(f'Failed to retrieve {len(failed_games)} game(s): {list(failed_games.keys())}')
+
+        return [data for data in data_total if data is not None]
+
+    def get_game_df(self, game_id: int):
+        """
+        Retrieves the live feed for a single game ID and converts it straight into a Polars DataFrame.
+        Games in progress are followed with get_live_data_df, so the next call for them only downloads what changed.
+
+        Parameters:
+        - game_id (int): The game ID for which to retrieve live data.
+
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data.
+        """
+        feed = None
+        if game_id not in self._live_games:
+            feed = self.get_game_feed(game_id)
+            if feed['gameData']['status']['abstractGameState'] == 'Final':
+                # The raw feed goes out of scope as soon as it is flattened
+                return self._data_df([feed])
+
+        return self._flight.do(('live', game_id), lambda: self._get_live_data_df(game_id, feed))
+
+    def iter_data_df(self, game_list_input: list, max_workers: int = 8, with_game_id: bool = False, failed_games: dict = None):
+        """
+        Retrieves and converts live game data one game at a time, without holding every raw feed in memory.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs for which to retrieve live data.
+        - max_workers (int): The maximum number of games downloaded and converted concurrently. Default is 8.
+        - with_game_id (bool): Whether to yield (game_id, data_df) tuples instead of bare DataFrames. Default is False.
+        - failed_games (dict): An optional dict the error of each game that could not be retrieved is written to, keyed by game ID. Default is None.
+
+        Yields:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data for each game ID, in input order.
+          Games that could not be retrieved are skipped.
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+
+        failed_games = failed_games if failed_games is not None else {}
+        games = iter(game_list_input)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                tqdm(total=len(game_list_input), desc="Processing", unit="iteration") as progress:
+            # Only max_workers games are ever in flight, so at most that many feeds are held at once
+            pending = deque()
+            for _, game_id in zip(range(max_workers), games):
+                pending.append((game_id, executor.submit(self.get_game_df, game_id)))
+
+            while pending:
+                game_id, future = pending.popleft()
+                try:
+                    data_df = future.result()
+                except (requests.RequestException, ValueError) as e:
+                    failed_games[game_id] = str(e)
+                    data_df = None
+
+                # Keep the pool busy with the next game before handing this one back
+                for next_game_id in games:
+                    pending.append((next_game_id, executor.submit(self.get_game_df, next_game_id)))
+                    break
+
+                progress.update(1)
+                if data_df is not None:
+                    yield (game_id, data_df) if with_game_id else data_df
+
+        if failed_games:
+            print(f'Failed to retrieve {len(failed_games)} game(s): {list(failed_games.keys())}')
+
+    def get_data_stream_df(self, game_list_input: list, max_workers: int = 8, failed_games: dict = None):
+        """
+        Retrieves live game data for a list of game IDs and converts it into a single Polars DataFrame,
+        flattening each game as it arrives.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs for which to retrieve live data.
+        - max_workers (int): The maximum number of games downloaded and converted concurrently. Default is 8.
+        - failed_games (dict): An optional dict the error of each game that could not be retrieved is written to, keyed by game ID. Default is None.
+
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data.
+        """
+        frames = list(self.iter_data_df(game_list_input, max_workers=max_workers, failed_games=failed_games))
+        if len(frames) == 0:
+            return self._data_df([])
+        return pl.concat(frames, how='vertical_relaxed')
+
+    def get_pitch_data(self, game_list_input: list, sport_id: int, max_workers: int = 8, failed_games: dict = None):
+        """
+        Retrieves the pitch data for a list of game IDs, reading finished games from the pitch store and
+        only scraping the games it does not hold yet. Newly scraped finished games are written to the store.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs for which to retrieve pitch data.
+        - sport_id (int): The sport ID the games were played in.
+        - max_workers (int): The maximum number of games downloaded and converted concurrently. Default is 8.
+        - failed_games (dict): An optional dict the error of each game that could not be retrieved is written to, keyed by game ID. Default is None.
+
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data.
+        """
+        if self.pitch_store is None:
+            return self.get_data_stream_df(game_list_input, max_workers=max_workers, failed_games=failed_games)
+
+        stored = self.pitch_store.game_files()
+        stored_games = [game_id for game_id in game_list_input if game_id in stored]
+        missing_games = [game_id for game_id in game_list_input if game_id not in stored]
+
+        # Only finished games are ever written to the store
+        self._final_games.update(stored_games)
+
+        frames = [self.pitch_store.read(stored_games, game_files=stored)]
+        for game_id, data_df in self.iter_data_df(missing_games, max_workers=max_workers, with_game_id=True, failed_games=failed_games):
+            # Games still in progress are left out of the store so they are scraped again next time
+            if len(data_df) > 0 and game_id in self._final_games:
+                self.pitch_store.upsert(data_df, sport_id=sport_id)
+            frames.append(data_df)
+
+        return pl.concat(frames, how='vertical_relaxed')
+
+    def _apply_json_patch(self, doc: dict, operations: list):
+        """
+        Applies a list of JSON Patch (RFC 6902) operations to a feed in place.
+
+        Parameters:
+        - doc (dict): The feed to patch.
+        - operations (list): The add, replace and remove operations to apply.
+        """
+        for operation in operations:
+            # Walk the JSON Pointer down to the parent of the target
+            keys = [k.replace('~1', '/').replace('~0', '~') for k in operation['path'].split('/')[1:]]
+            parent = doc
+            for k in keys[:-1]:
+                parent = parent[int(k)] if isinstance(parent, list) else parent[k]
+
+            op = operation['op']
+            last = keys[-1]
+            if isinstance(parent, list):
+                index = len(parent) if last == '-' else int(last)
+                if op == 'add':
+                    parent.insert(index, operation['value'])
+                elif op == 'replace':
+                    parent[index] = operation['value']
+                elif op == 'remove':
+                    del parent[index]
+                else:
+                    raise ValueError(f"Unsupported patch operation {op}")
+            else:
+                if op in ('add', 'replace'):
+                    parent[last] = operation['value']
+                elif op == 'remove':
+                    del parent[last]
+                else:
+                    raise ValueError(f"Unsupported patch operation {op}")
+
+    def get_live_data_df(self, game_id: int):
+        """
+        Retrieves the pitch data for a game, downloading and parsing only what changed since the last call for the same game.
+        The first call downloads the whole feed, later calls request the feed's diffPatch from the last timecode and
+        re-parse the at-bat that was in progress, any new ones, and any earlier at-bat the patch changed.
+
+        Concurrent calls for the same game share one update. A game's state is dropped once it is final, when it has not
+        been updated for live_ttl seconds, or when more than max_live_games games are followed.
+
+        Parameters:
+        - game_id (int): The game ID for which to retrieve live data.
+
+        Returns:
+        - df (pl.DataFrame): A DataFrame containing the structured game data, as returned by get_data_df.
+        """
+        return self._flight.do(('live', game_id), lambda: self._get_live_data_df(game_id))
+
+    def _touched_play(self, operations: list):
+        """
+        Finds the first at-bat whose rows a list of JSON Patch operations can change.
+
+        Parameters:
+        - operations (list): The add, replace and remove operations of one diffPatch entry.
+
+        Returns:
+        - index (int): The index in allPlays of the first at-bat changed, 0 when the game-wide data every row is built from changed,
+          or None when no parsed at-bat is affected.
+        """
+        plays_path = ['liveData', 'plays', 'allPlays']
+        first = None
+        for operation in operations:
+            keys = operation['path'].split('/')[1:]
+            if keys[:3] == plays_path and len(keys) > 3:
+                # Appending an at-bat leaves the ones before it alone
+                if keys[3] == '-':
+                    continue
+                index = int(keys[3])
+            elif keys == plays_path[:len(keys)] or keys == ['gameData'] or keys[:2] in (['gameData', 'teams'], ['gameData', 'datetime']):
+                index = 0
+            else:
+                continue
+            first = index if first is None else min(first, index)
+        return first
+
+    def _prune_live_games(self):
+        # Forget games not updated for live_ttl seconds, such as suspended games that never reach Final,
+        # then the least recently updated ones beyond max_live_games
+        now = time.time()
+        with self._lock:
+            for game_id in [game_id for game_id, state in self._live_games.items() if now - state['updated'] > self.live_ttl]:
+                del self._live_games[game_id]
+            while len(self._live_games) > self.max_live_games:
+                self._live_games.popitem(last=False)
+
+    def _get_live_data_df(self, game_id: int, feed: dict = None):
+        with self._lock:
+            state = self._live_games.get(game_id)
+
+        if state is not None:
+            # Ask only for the changes made to the feed since the last timecode we have seen
+            r = self.session.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live/diffPatch',
+                                 params={'startTimecode': state['feed']['metaData']['timeStamp']},
+                                 timeout=self.timeout)
+            r.raise_for_status()
+            patch = r.json()
+
+            # The at-bat that was still open on the last call is always parsed again
+            reparse_from = max(len(state['play_rows']) - 1, 0)
+            if isinstance(patch, dict):
+                # The API sends the whole feed back when it is smaller than the diff
+                state = None
+                feed = patch
+            else:
+                try:
+                    for p in patch:
+                        self._apply_json_patch(state['feed'], p['diff'])
+                        touched = self._touched_play(p['diff'])
+                        if touched is not None:
+                            reparse_from = min(reparse_from, touched)
+                except (KeyError, IndexError, ValueError):
+                    # Fall back to a full download if the patch does not line up with our copy
+                    state = None
+                    feed = copy.deepcopy(self.get_game_feed(game_id))
+        else:
+            # The feed is patched in place later on, so it must not be the copy shared with other callers
+            feed = copy.deepcopy(feed if feed is not None else self.get_game_feed(game_id))
+
+        if state is None:
+            # play_rows holds the number of rows parsed from each at-bat, in allPlays order
+            state = {'feed': feed, 'df': None, 'play_rows': []}
+            reparse_from = 0
+
+        feed = state['feed']
+        plays = feed['liveData']['plays']['allPlays']
+
+        # Keep the rows of the at-bats before the first one that changed, and parse it and every at-bat after it again
+        reparse_from = min(reparse_from, len(state['play_rows']))
+        kept_rows = sum(state['play_rows'][:reparse_from])
+        play_rows = state['play_rows'][:reparse_from]
+        rows = []
+        game = {'gamePk': feed['gamePk'], 'gameData': feed['gameData'], 'liveData': {'plays': {'allPlays': None}}}
+        for play in plays[reparse_from:]:
+            game['liveData']['plays']['allPlays'] = [play]
+            play_list = self._game_rows(game)
+            play_rows.append(len(play_list))
+            rows.extend(play_list)
+
+        new_df = self._rows_df(rows)
+        state['df'] = pl.concat([state['df'].head(kept_rows), new_df], how='vertical_relaxed') if state['df'] is not None else new_df
+        state['play_rows'] = play_rows
+        state['updated'] = time.time()
+
+        with self._lock:
+            # A finished game no longer changes, so there is nothing left to patch
+            if feed['gameData']['status']['abstractGameState'] == 'Final':
+                self._final_games.add(game_id)
+                self._live_games.pop(game_id, None)
+            else:
+                self._live_games[game_id] = state
+                self._live_games.move_to_end(game_id)
+        self._prune_live_games()
+
+        return state['df']
+
+    def _game_rows(self, data: dict):
+        """
+        Flattens a single game's feed into one row per pitch, ordered as PITCH_COLUMNS.
+
+        Parameters:
+        - data (dict): A JSON object containing game data.
+
+        Returns:
+        - rows (list): A list of tuples, one per pitch or walk-ending event.
+        """
+        swing_list = ('X', 'F', 'S', 'D', 'E', 'T', 'W')
+        whiff_list = ('S', 'T', 'W')
+        empty = {}
+
+        game_id = data['gamePk']
+        game_date = date.fromisoformat(data['gameData']['datetime']['officialDate'])
+
+        # Resolve both teams once per game
+        teams = data['gameData']['teams']
+        away = teams.get('away')
+        home = teams.get('home')
+        away_abb, away_id = (away['abbreviation'], away['id']) if away is not None else (None, None)
+        home_abb, home_id = (home['abbreviation'], home['id']) if home is not None else (None, None)
+
+        # Placeholder for the pitch tracking and batted ball columns when an event has none
+        no_pitch_data = (None,) * 28
+        no_hit_data = (None,) * 8
+
+        rows = []
+        append = rows.append
+        for ab in data['liveData']['plays']['allPlays']:
+            events = ab['playEvents']
+            last_n = len(events) - 1
+            ab_number = ab.get('atBatIndex')
+            result = ab['result']
+
+            # Resolve the matchup once per at-bat
+            matchup = ab.get('matchup', empty)
+            batter = matchup.get('batter')
+            pitcher = matchup.get('pitcher')
+            bat_side = matchup.get('batSide')
+            pitch_hand = matchup.get('pitchHand')
+            batter_id = batter['id'] if batter is not None else None
+            batter_name = batter.get('fullName') if batter is not None else None
+            batter_hand = bat_side['code'] if bat_side is not None else None
+            pitcher_id = pitcher['id'] if pitcher is not None else None
+            pitcher_name = pitcher.get('fullName') if pitcher is not None else None
+            pitcher_hand = pitch_hand['code'] if pitch_hand is not None else None
+
+            if ab['about']['isTopInning']:
+                batter_team, batter_team_id, pitcher_team, pitcher_team_id = away_abb, away_id, home_abb, home_id
+            else:
+                batter_team, batter_team_id, pitcher_team, pitcher_team_id = home_abb, home_id, away_abb, away_id
+
+            # The at-bat result is only reported on its final event
+            result_values = (result.get('type'),
+                             result.get('event'),
+                             result.get('eventType'),
+                             result.get('rbi'),
+                             result.get('awayScore'),
+                             result.get('homeScore'),
+                             result.get('isOut'))
+            no_result_values = (None,) * 7
+
+            for n, ev in enumerate(events):
+                details = ev['details']
+                count = ev['count']
+
+                if ev.get('isPitch') == True or 'call' in details:
+                    code = details.get('code')
+                    pitch_type_dict = details.get('type')
+
+                    if ev.get('pitchNumber') == 1:
+                        strikes, balls = 0, 0
+                        outs = count.get('outs')
+                    else:
+                        prev_count = events[n - 1]['count']
+                        strikes = prev_count.get('strikes')
+                        balls = prev_count.get('balls')
+                        outs = prev_count.get('outs')
+
+                    pitch_data = ev.get('pitchData')
+                    if pitch_data is not None:
+                        coords = pitch_data.get('coordinates', empty)
+                        breaks = pitch_data.get('breaks', empty)
+                        pitch_values = (pitch_data.get('startSpeed'),
+                                        pitch_data.get('endSpeed'),
+                                        pitch_data.get('strikeZoneTop'),
+                                        pitch_data.get('strikeZoneBottom'),
+                                        coords.get('x'),
+                                        coords.get('y'),
+                                        coords.get('aX'),
+                                        coords.get('aY'),
+                                        coords.get('aZ'),
+                                        coords.get('pfxX'),
+                                        coords.get('pfxZ'),
+                                        coords.get('pX'),
+                                        coords.get('pZ'),
+                                        coords.get('vX0'),
+                                        coords.get('vY0'),
+                                        coords.get('vZ0'),
+                                        coords.get('x0'),
+                                        coords.get('y0'),
+                                        coords.get('z0'),
+                                        pitch_data.get('zone'),
+                                        pitch_data.get('typeConfidence'),
+                                        pitch_data.get('plateTime'),
+                                        pitch_data.get('extension'),
+                                        breaks.get('spinRate'),
+                                        breaks.get('spinDirection'),
+                                        breaks.get('breakVertical'),
+                                        breaks.get('breakVerticalInduced'),
+                                        breaks.get('breakHorizontal'))
+                    else:
+                        pitch_values = no_pitch_data
+
+                    hit_data = ev.get('hitData')
+                    if hit_data is not None:
+                        hit_coords = hit_data.get('coordinates', empty)
+                        hit_values = (hit_data.get('launchSpeed'),
+                                      hit_data.get('launchAngle'),
+                                      hit_data.get('totalDistance'),
+                                      hit_data.get('location'),
+                                      hit_data.get('trajectory'),
+                                      hit_data.get('hardness'),
+                                      hit_coords.get('coordX'),
+                                      hit_coords.get('coordY'))
+                    else:
+                        hit_values = no_hit_data
+
+                    (type_ab, event, event_type, rbi,
+                     away_score, home_score, is_out) = result_values if n == last_n else no_result_values
+
+                    append((game_id, game_date,
+                            batter_id, batter_name, batter_hand, batter_team, batter_team_id,
+                            pitcher_id, pitcher_name, pitcher_hand, pitcher_team, pitcher_team_id,
+                            ab_number,
+                            details.get('description'),
+                            code,
+                            details.get('isInPlay'),
+                            details.get('isStrike'),
+                            True if code in swing_list else None,
+                            True if code in whiff_list else None,
+                            is_out,
+                            details.get('isOut'),
+                            details.get('hasReview'),
+                            pitch_type_dict['code'] if pitch_type_dict is not None else None,
+                            pitch_type_dict['description'] if pitch_type_dict is not None else None,
+                            strikes, balls, outs,
+                            count.get('strikes'),
+                            count.get('balls'),
+                            count.get('outs'))
+                           + pitch_values
+                           + hit_values
+                           + (ev.get('index'),
+                              ev.get('playId'),
+                              ev.get('startTime'),
+                              ev.get('endTime'),
+                              ev.get('isPitch'),
+                              ev.get('type'),
+                              type_ab, event, event_type, rbi, away_score, home_score))
+
+                elif count['balls'] == 4:
+                    # Walks without a pitch (e.g. automatic intentional walks) keep the historical
+                    # column quirks of this branch: the count is reported swapped and the
+                    # pitcher_team_id is taken from the batting side.
+                    if ab['about']['isTopInning']:
+                        walk_pitcher_team_id = away_id
+                    else:
+                        walk_pitcher_team_id = home_id
+
+                    append((game_id, game_date,
+                            batter_id,
+                            batter['fullName'] if batter is not None else None,
+                            batter_hand, batter_team, batter_team_id,
+                            pitcher_id,
+                            pitcher['fullName'] if pitcher is not None else None,
+                            pitcher_hand, pitcher_team, walk_pitcher_team_id,
+                            None,
+                            None, None, None, None, None, None, None, None, None, None, None,
+                            count.get('balls'),
+                            count.get('strikes'),
+                            count.get('outs'),
+                            count.get('balls'),
+                            count.get('strikes'),
+                            count.get('outs'))
+                           + no_pitch_data
+                           + no_hit_data
+                           + (ev.get('index'),
+                              ev.get('playId'),
+                              ev.get('startTime'),
+                              ev.get('endTime'),
+                              ev.get('isPitch'),
+                              ev.get('type'),
+                              None,
+                              result['event'],
+                              result['eventType'],
+                              None, None, None))
+
+        return rows
 
     def get_data_df(self, data_list):
         """
         Converts a list of game data JSON objects into a Polars DataFrame.
-        
+
         Parameters:
         - data_list (list): A list of JSON objects containing game data.
-        
+
         Returns:
         - data_df (pl.DataFrame): A DataFrame containing the structured game data.
         """
-        swing_list = ['X','F','S','D','E','T','W']
-        whiff_list = ['S','T','W']
         print('Converting Data to Dataframe.')
-        game_id = []
-        game_date = []
-        batter_id = []
-        batter_name = []
-        batter_hand = []
-        batter_team = []
-        batter_team_id = []
-        pitcher_id = []
-        pitcher_name = []
-        pitcher_hand = []
-        pitcher_team = []
-        pitcher_team_id = []
-
-        play_description = []
-        play_code = []
-        in_play = []
-        is_strike = []
-        is_swing = []
-        is_whiff = []
-        is_out = []
-        is_ball = []
-        is_review = []
-        pitch_type = []
-        pitch_description = []
-        strikes = []
-        balls = []
-        outs = []
-        strikes_after = []
-        balls_after = []
-        outs_after = []
-
-        start_speed = []
-        end_speed = []
-        sz_top = []
-        sz_bot = []
-        x = []
-        y = []
-        ax = []
-        ay = []
-        az = []
-        pfxx = []
-        pfxz = []
-        px = []
-        pz = []
-        vx0 = []
-        vy0 = []
-        vz0 = []
-        x0 = []
-        y0 = []
-        z0 = []
-        zone = []
-        type_confidence = []
-        plate_time = []
-        extension = []
-        spin_rate = []
-        spin_direction = []
-        vb = []
-        ivb = []
-        hb = []
-
-        launch_speed = []
-        launch_angle = []
-        launch_distance = []
-        launch_location = []
-        trajectory = []
-        hardness = []
-        hit_x = []
-        hit_y = []
-
-        index_play = []
-        play_id = []
-        start_time = []
-        end_time = []
-        is_pitch = []
-        type_type = []
-
-
-        type_ab = []
-        ab_number = []
-        event = []
-        event_type = []
-        rbi = []
-        away_score = []
-        home_score = []
+        return self._data_df(data_list)
 
+    def _data_df(self, data_list):
+        # Build the rows game by game, then load them into the typed schema once
+        rows = []
         for data in data_list:
-            for ab_id in range(len(data['liveData']['plays']['allPlays'])):
-                ab_list = data['liveData']['plays']['allPlays'][ab_id]
-                for n in range(len(ab_list['playEvents'])):
-            
-                    
-                    if ab_list['playEvents'][n]['isPitch'] == True or 'call' in ab_list['playEvents'][n]['details']:
-                        ab_number.append(ab_list['atBatIndex'] if 'atBatIndex' in ab_list else np.nan)
-
-                        game_id.append(data['gamePk'])
-                        game_date.append(data['gameData']['datetime']['officialDate'])
-                        if 'matchup' in ab_list:
-                          batter_id.append(ab_list['matchup']['batter']['id'] if 'batter' in ab_list['matchup'] else np.nan)
-                          if 'batter' in ab_list['matchup']:
-                            batter_name.append(ab_list['matchup']['batter']['fullName'] if 'fullName' in ab_list['matchup']['batter'] else np.nan)
-                          else:
-                            batter_name.append(np.nan)
-
-                          batter_hand.append(ab_list['matchup']['batSide']['code'] if 'batSide' in ab_list['matchup'] else np.nan)
-                          pitcher_id.append(ab_list['matchup']['pitcher']['id'] if 'pitcher' in ab_list['matchup'] else np.nan)
-                          if 'pitcher' in ab_list['matchup']:
-                            pitcher_name.append(ab_list['matchup']['pitcher']['fullName'] if 'fullName' in ab_list['matchup']['pitcher'] else np.nan)
-                          else:
-                            pitcher_name.append(np.nan)
-                        
-                          pitcher_hand.append(ab_list['matchup']['pitchHand']['code'] if 'pitchHand' in ab_list['matchup'] else np.nan)
-
-
-                        if ab_list['about']['isTopInning']:
-                            batter_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else np.nan)
-                            batter_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else np.nan)
-                            pitcher_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else np.nan)
-                            pitcher_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else np.nan)
-
-                        else:
-                            batter_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else np.nan)
-                            batter_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else np.nan)
-                            pitcher_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else np.nan)
-                            pitcher_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else np.nan)
-
-                        play_description.append(ab_list['playEvents'][n]['details']['description'] if 'description' in ab_list['playEvents'][n]['details'] else np.nan)
-                        play_code.append(ab_list['playEvents'][n]['details']['code'] if 'code' in ab_list['playEvents'][n]['details'] else np.nan)
-                        in_play.append(ab_list['playEvents'][n]['details']['isInPlay'] if 'isInPlay' in ab_list['playEvents'][n]['details'] else np.nan)
-                        is_strike.append(ab_list['playEvents'][n]['details']['isStrike'] if 'isStrike' in ab_list['playEvents'][n]['details'] else np.nan)
-
-                        if 'details' in ab_list['playEvents'][n]:
-                            is_swing.append(True if ab_list['playEvents'][n]['details']['code'] in swing_list else np.nan)
-                            is_whiff.append(True if ab_list['playEvents'][n]['details']['code'] in whiff_list else np.nan)
-                        else:
-                            is_swing.append(np.nan)
-                            is_whiff.append(np.nan)
-
-                        is_ball.append(ab_list['playEvents'][n]['details']['isOut'] if 'isOut' in ab_list['playEvents'][n]['details'] else np.nan)
-                        is_review.append(ab_list['playEvents'][n]['details']['hasReview'] if 'hasReview' in ab_list['playEvents'][n]['details'] else np.nan)
-                        pitch_type.append(ab_list['playEvents'][n]['details']['type']['code'] if 'type' in ab_list['playEvents'][n]['details'] else np.nan)
-                        pitch_description.append(ab_list['playEvents'][n]['details']['type']['description'] if 'type' in ab_list['playEvents'][n]['details'] else np.nan)
-
-                        if ab_list['playEvents'][n]['pitchNumber'] == 1:
-                            strikes.append(0)
-                            balls.append(0)
-                            strikes_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else np.nan)
-                            balls_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else np.nan)
-                            outs.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else np.nan)
-                            outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else np.nan)
-
-                        else:
-                            strikes.append(ab_list['playEvents'][n-1]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n-1]['count'] else np.nan)
-                            balls.append(ab_list['playEvents'][n-1]['count']['balls'] if 'balls' in ab_list['playEvents'][n-1]['count'] else np.nan)
-                            outs.append(ab_list['playEvents'][n-1]['count']['outs'] if 'outs' in ab_list['playEvents'][n-1]['count'] else np.nan)
-
-                            strikes_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else np.nan)
-                            balls_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else np.nan)
-                            outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else np.nan)
-
-
-                        if 'pitchData' in ab_list['playEvents'][n]:
-
-                            start_speed.append(ab_list['playEvents'][n]['pitchData']['startSpeed'] if 'startSpeed' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-                            end_speed.append(ab_list['playEvents'][n]['pitchData']['endSpeed'] if 'endSpeed' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-
-                            sz_top.append(ab_list['playEvents'][n]['pitchData']['strikeZoneTop'] if 'strikeZoneTop' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-                            sz_bot.append(ab_list['playEvents'][n]['pitchData']['strikeZoneBottom'] if 'strikeZoneBottom' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-                            x.append(ab_list['playEvents'][n]['pitchData']['coordinates']['x'] if 'x' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            y.append(ab_list['playEvents'][n]['pitchData']['coordinates']['y'] if 'y' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-
-                            ax.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aX'] if 'aX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            ay.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aY'] if 'aY' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            az.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aZ'] if 'aZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            pfxx.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pfxX'] if 'pfxX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            pfxz.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pfxZ'] if 'pfxZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            px.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pX'] if 'pX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            pz.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pZ'] if 'pZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            vx0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vX0'] if 'vX0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            vy0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vY0'] if 'vY0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            vz0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vZ0'] if 'vZ0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            x0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['x0'] if 'x0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            y0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['y0'] if 'y0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-                            z0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['z0'] if 'z0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else np.nan)
-
-                            zone.append(ab_list['playEvents'][n]['pitchData']['zone'] if 'zone' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-                            type_confidence.append(ab_list['playEvents'][n]['pitchData']['typeConfidence'] if 'typeConfidence' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-                            plate_time.append(ab_list['playEvents'][n]['pitchData']['plateTime'] if 'plateTime' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-                            extension.append(ab_list['playEvents'][n]['pitchData']['extension'] if 'extension' in ab_list['playEvents'][n]['pitchData'] else np.nan)
-
-                            if 'breaks' in ab_list['playEvents'][n]['pitchData']:
-                                spin_rate.append(ab_list['playEvents'][n]['pitchData']['breaks']['spinRate'] if 'spinRate' in ab_list['playEvents'][n]['pitchData']['breaks'] else np.nan)
-                                spin_direction.append(ab_list['playEvents'][n]['pitchData']['breaks']['spinDirection'] if 'spinDirection' in ab_list['playEvents'][n]['pitchData']['breaks'] else np.nan)
-                                vb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakVertical'] if 'breakVertical' in ab_list['playEvents'][n]['pitchData']['breaks'] else np.nan)                               
-                                ivb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakVerticalInduced'] if 'breakVerticalInduced' in ab_list['playEvents'][n]['pitchData']['breaks'] else np.nan)
-                                hb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakHorizontal'] if 'breakHorizontal' in ab_list['playEvents'][n]['pitchData']['breaks'] else np.nan)
-
-                        else:
-                            start_speed.append(np.nan)
-                            end_speed.append(np.nan)
-
-                            sz_top.append(np.nan)
-                            sz_bot.append(np.nan)
-                            x.append(np.nan)
-                            y.append(np.nan)
-
-                            ax.append(np.nan)
-                            ay.append(np.nan)
-                            az.append(np.nan)
-                            pfxx.append(np.nan)
-                            pfxz.append(np.nan)
-                            px.append(np.nan)
-                            pz.append(np.nan)
-                            vx0.append(np.nan)
-                            vy0.append(np.nan)
-                            vz0.append(np.nan)
-                            x0.append(np.nan)
-                            y0.append(np.nan)
-                            z0.append(np.nan)
-
-                            zone.append(np.nan)
-                            type_confidence.append(np.nan)
-                            plate_time.append(np.nan)
-                            extension.append(np.nan)
-                            spin_rate.append(np.nan)
-                            spin_direction.append(np.nan)
-                            vb.append(np.nan)
-                            ivb.append(np.nan)
-                            hb.append(np.nan)
-
-                        if 'hitData' in ab_list['playEvents'][n]:
-                            launch_speed.append(ab_list['playEvents'][n]['hitData']['launchSpeed'] if 'launchSpeed' in ab_list['playEvents'][n]['hitData'] else np.nan)
-                            launch_angle.append(ab_list['playEvents'][n]['hitData']['launchAngle'] if 'launchAngle' in ab_list['playEvents'][n]['hitData'] else np.nan)
-                            launch_distance.append(ab_list['playEvents'][n]['hitData']['totalDistance'] if 'totalDistance' in ab_list['playEvents'][n]['hitData'] else np.nan)
-                            launch_location.append(ab_list['playEvents'][n]['hitData']['location'] if 'location' in ab_list['playEvents'][n]['hitData'] else np.nan)
-
-                            trajectory.append(ab_list['playEvents'][n]['hitData']['trajectory'] if 'trajectory' in ab_list['playEvents'][n]['hitData'] else np.nan)
-                            hardness.append(ab_list['playEvents'][n]['hitData']['hardness'] if 'hardness' in ab_list['playEvents'][n]['hitData'] else np.nan)
-                            hit_x.append(ab_list['playEvents'][n]['hitData']['coordinates']['coordX'] if 'coordX' in ab_list['playEvents'][n]['hitData']['coordinates'] else np.nan)
-                            hit_y.append(ab_list['playEvents'][n]['hitData']['coordinates']['coordY'] if 'coordY' in ab_list['playEvents'][n]['hitData']['coordinates'] else np.nan)
-                        else:
-                            launch_speed.append(np.nan)
-                            launch_angle.append(np.nan)
-                            launch_distance.append(np.nan)
-                            launch_location.append(np.nan)
-                            trajectory.append(np.nan)
-                            hardness.append(np.nan)
-                            hit_x.append(np.nan)
-                            hit_y.append(np.nan)
-
-                        index_play.append(ab_list['playEvents'][n]['index'] if 'index' in ab_list['playEvents'][n] else np.nan)
-                        play_id.append(ab_list['playEvents'][n]['playId'] if 'playId' in ab_list['playEvents'][n] else np.nan)
-                        start_time.append(ab_list['playEvents'][n]['startTime'] if 'startTime' in ab_list['playEvents'][n] else np.nan)
-                        end_time.append(ab_list['playEvents'][n]['endTime'] if 'endTime' in ab_list['playEvents'][n] else np.nan)
-                        is_pitch.append(ab_list['playEvents'][n]['isPitch'] if 'isPitch' in ab_list['playEvents'][n] else np.nan)
-                        type_type.append(ab_list['playEvents'][n]['type'] if 'type' in ab_list['playEvents'][n] else np.nan)
-
-
-
-                        if n == len(ab_list['playEvents']) - 1 :
-
-                            type_ab.append(data['liveData']['plays']['allPlays'][ab_id]['result']['type'] if 'type' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-                            event.append(data['liveData']['plays']['allPlays'][ab_id]['result']['event'] if 'event' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-                            event_type.append(data['liveData']['plays']['allPlays'][ab_id]['result']['eventType'] if 'eventType' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-                            rbi.append(data['liveData']['plays']['allPlays'][ab_id]['result']['rbi'] if 'rbi' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-                            away_score.append(data['liveData']['plays']['allPlays'][ab_id]['result']['awayScore'] if 'awayScore' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-                            home_score.append(data['liveData']['plays']['allPlays'][ab_id]['result']['homeScore'] if 'homeScore' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-                            is_out.append(data['liveData']['plays']['allPlays'][ab_id]['result']['isOut'] if 'isOut' in data['liveData']['plays']['allPlays'][ab_id]['result'] else np.nan)
-
-                        else:
-
-                            type_ab.append(np.nan)
-                            event.append(np.nan)
-                            event_type.append(np.nan)
-                            rbi.append(np.nan)
-                            away_score.append(np.nan)
-                            home_score.append(np.nan)
-                            is_out.append(np.nan)
-
-                    elif ab_list['playEvents'][n]['count']['balls'] == 4:
-
-                        event.append(data['liveData']['plays']['allPlays'][ab_id]['result']['event'])
-                        event_type.append(data['liveData']['plays']['allPlays'][ab_id]['result']['eventType'])
-
-
-                        game_id.append(data['gamePk'])
-                        game_date.append(data['gameData']['datetime']['officialDate'])
-                        batter_id.append(ab_list['matchup']['batter']['id'] if 'batter' in ab_list['matchup'] else np.nan)
-                        batter_name.append(ab_list['matchup']['batter']['fullName'] if 'batter' in ab_list['matchup'] else np.nan)
-                        batter_hand.append(ab_list['matchup']['batSide']['code'] if 'batSide' in ab_list['matchup'] else np.nan)
-                        pitcher_id.append(ab_list['matchup']['pitcher']['id'] if 'pitcher' in ab_list['matchup'] else np.nan)
-                        pitcher_name.append(ab_list['matchup']['pitcher']['fullName'] if 'pitcher' in ab_list['matchup'] else np.nan)
-                        pitcher_hand.append(ab_list['matchup']['pitchHand']['code'] if 'pitchHand' in ab_list['matchup'] else np.nan)
-                        if ab_list['about']['isTopInning']:
-                            batter_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else np.nan)
-                            batter_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else np.nan)
-                            pitcher_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else np.nan)
-                            pitcher_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else np.nan)
-                        else:
-                            batter_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else np.nan)
-                            batter_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else np.nan)
-                            pitcher_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else np.nan)
-                            pitcher_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else np.nan)
-
-                        play_description.append(np.nan)
-                        play_code.append(np.nan)
-                        in_play.append(np.nan)
-                        is_strike.append(np.nan)
-                        is_ball.append(np.nan)
-                        is_review.append(np.nan)
-                        pitch_type.append(np.nan)
-                        pitch_description.append(np.nan)
-                        strikes.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else np.nan)
-                        balls.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else np.nan)
-                        outs.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else np.nan)
-                        strikes_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else np.nan)
-                        balls_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else np.nan)
-                        outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else np.nan)
-                        index_play.append(ab_list['playEvents'][n]['index'] if 'index' in ab_list['playEvents'][n] else np.nan)
-                        play_id.append(ab_list['playEvents'][n]['playId'] if 'playId' in ab_list['playEvents'][n] else np.nan)
-                        start_time.append(ab_list['playEvents'][n]['startTime'] if 'startTime' in ab_list['playEvents'][n] else np.nan)
-                        end_time.append(ab_list['playEvents'][n]['endTime'] if 'endTime' in ab_list['playEvents'][n] else np.nan)
-                        is_pitch.append(ab_list['playEvents'][n]['isPitch'] if 'isPitch' in ab_list['playEvents'][n] else np.nan)
-                        type_type.append(ab_list['playEvents'][n]['type'] if 'type' in ab_list['playEvents'][n] else np.nan)
-
-
-
-                        is_swing.append(np.nan)
-                        is_whiff.append(np.nan)
-                        start_speed.append(np.nan)
-                        end_speed.append(np.nan)
-                        sz_top.append(np.nan)
-                        sz_bot.append(np.nan)
-                        x.append(np.nan)
-                        y.append(np.nan)
-                        ax.append(np.nan)
-                        ay.append(np.nan)
-                        az.append(np.nan)
-                        pfxx.append(np.nan)
-                        pfxz.append(np.nan)
-                        px.append(np.nan)
-                        pz.append(np.nan)
-                        vx0.append(np.nan)
-                        vy0.append(np.nan)
-                        vz0.append(np.nan)
-                        x0.append(np.nan)
-                        y0.append(np.nan)
-                        z0.append(np.nan)
-                        zone.append(np.nan)
-                        type_confidence.append(np.nan)
-                        plate_time.append(np.nan)
-                        extension.append(np.nan)
-                        spin_rate.append(np.nan)
-                        spin_direction.append(np.nan)
-                        vb.append(np.nan)
-                        ivb.append(np.nan)
-                        hb.append(np.nan)
-                        launch_speed.append(np.nan)
-                        launch_angle.append(np.nan)
-                        launch_distance.append(np.nan)
-                        launch_location.append(np.nan)
-                        trajectory.append(np.nan)
-                        hardness.append(np.nan)
-                        hit_x.append(np.nan)
-                        hit_y.append(np.nan)
-                        type_ab.append(np.nan)
-                        ab_number.append(np.nan)
-
-                        rbi.append(np.nan)
-                        away_score.append(np.nan)
-                        home_score.append(np.nan)
-                        is_out.append(np.nan)
-                        
-        # print({
-        #     'game_id':len(game_id),
-        #     'game_date':len(game_date),
-        #     'batter_id':len(batter_id),
-        #     'batter_name':len(batter_name),
-        #     'batter_hand':len(batter_hand),
-        #     'batter_team':len(batter_team),
-        #     'batter_team_id':len(batter_team_id),
-        #     'pitcher_id':len(pitcher_id),
-        #     'pitcher_name':len(pitcher_name),
-        #     'pitcher_hand':len(pitcher_hand),
-        #     'pitcher_team':len(pitcher_team),
-        #     'pitcher_team_id':len(pitcher_team_id),
-            
-        #     'play_description':len(play_description),
-        #     'play_code':len(play_code),
-        #     'in_play':len(in_play),
-        #     'is_strike':len(is_strike),
-        #     'is_swing':len(is_swing),
-        #     'is_whiff':len(is_whiff),
-        #     'is_out':len(is_out),
-        #     'is_ball':len(is_ball),
-        #     'is_review':len(is_review),
-        #     'pitch_type':len(pitch_type),
-        #     'pitch_description':len(pitch_description),
-        #     'strikes':len(strikes),
-        #     'balls':len(balls),
-        #     'outs':len(outs),
-        #     'strikes_after':len(strikes_after),
-        #     'balls_after':len(balls_after),
-        #     'outs_after':len(outs_after),            
-        #     'start_speed':len(start_speed),
-        #     'end_speed':len(end_speed),
-        #     'sz_top':len(sz_top),
-        #     'sz_bot':len(sz_bot),
-        #     'x':len(x),
-        #     'y':len(y),
-        #     'ax':len(ax),
-        #     'ay':len(ay),
-        #     'az':len(az),
-        #     'pfxx':len(pfxx),
-        #     'pfxz':len(pfxz),
-        #     'px':len(px),
-        #     'pz':len(pz),
-        #     'vx0':len(vx0),
-        #     'vy0':len(vy0),
-        #     'vz0':len(vz0),
-        #     'x0':len(x0),
-        #     'y0':len(y0),
-        #     'z0':len(z0),
-        #     'zone':len(zone),
-        #     'type_confidence':len(type_confidence),
-        #     'plate_time':len(plate_time),
-        #     'extension':len(extension),
-        #     'spin_rate':len(spin_rate),
-        #     'spin_direction':len(spin_direction),
-        #     'vb':len(vb),
-        #     'ivb':len(ivb),
-        #     'hb':len(hb),
-        #     'launch_speed':len(launch_speed),
-        #     'launch_angle':len(launch_angle),
-        #     'launch_distance':len(launch_distance),
-        #     'launch_location':len(launch_location),
-        #     'trajectory':len(trajectory),
-        #     'hardness':len(hardness),
-        #     'hit_x':len(hit_x),
-        #     'hit_y':len(hit_y),
-        #     'index_play':len(index_play),
-        #     'play_id':len(play_id),
-        #     'start_time':len(start_time),
-        #     'end_time':len(end_time),
-        #     'is_pitch':len(is_pitch),
-        #     'type_type':len(type_type),
-        #     'type_ab':len(type_ab),
-        #     'event':len(event),
-        #     'event_type':len(event_type),
-        #     'rbi':len(rbi),
-        #     'away_score':len(away_score),
-        #     'home_score':len(home_score),
-        #     }
-
-
-        # )
-        df  = pl.DataFrame(data={
-            'game_id':game_id,
-            'game_date':game_date,
-            'batter_id':batter_id,
-            'batter_name':batter_name,
-            'batter_hand':batter_hand,
-            'batter_team':batter_team,
-            'batter_team_id':batter_team_id,
-            'pitcher_id':pitcher_id,
-            'pitcher_name':pitcher_name,
-            'pitcher_hand':pitcher_hand,
-            'pitcher_team':pitcher_team,
-            'pitcher_team_id':pitcher_team_id,
-            'ab_number':ab_number,
-            'play_description':play_description,
-            'play_code':play_code,
-            'in_play':in_play,
-            'is_strike':is_strike,
-            'is_swing':is_swing,
-            'is_whiff':is_whiff,
-            'is_out':is_out,
-            'is_ball':is_ball,
-            'is_review':is_review,
-            'pitch_type':pitch_type,
-            'pitch_description':pitch_description,
-            'strikes':strikes,
-            'balls':balls,
-            'outs':outs,
-            'strikes_after':strikes_after,
-            'balls_after':balls_after,
-            'outs_after':outs_after,            
-            'start_speed':start_speed,
-            'end_speed':end_speed,
-            'sz_top':sz_top,
-            'sz_bot':sz_bot,
-            'x':x,
-            'y':y,
-            'ax':ax,
-            'ay':ay,
-            'az':az,
-            'pfxx':pfxx,
-            'pfxz':pfxz,
-            'px':px,
-            'pz':pz,
-            'vx0':vx0,
-            'vy0':vy0,
-            'vz0':vz0,
-            'x0':x0,
-            'y0':y0,
-            'z0':z0,
-            'zone':zone,
-            'type_confidence':type_confidence,
-            'plate_time':plate_time,
-            'extension':extension,
-            'spin_rate':spin_rate,
-            'spin_direction':spin_direction,
-            'vb':vb,
-            'ivb':ivb,
-            'hb':hb,
-            'launch_speed':launch_speed,
-            'launch_angle':launch_angle,
-            'launch_distance':launch_distance,
-            'launch_location':launch_location,
-            'trajectory':trajectory,
-            'hardness':hardness,
-            'hit_x':hit_x,
-            'hit_y':hit_y,
-            'index_play':index_play,
-            'play_id':play_id,
-            'start_time':start_time,
-            'end_time':end_time,
-            'is_pitch':is_pitch,
-            'type_type':type_type,
-            'type_ab':type_ab,
-            'event':event,
-            'event_type':event_type,
-            'rbi':rbi,
-            'away_score':away_score,
-            'home_score':home_score,
-
-            },strict=False
-            )
+            rows.extend(self._game_rows(data))
+
+        return self._rows_df(rows)
+
+    def _rows_df(self, rows):
+        # The row constructor drops the Categorical ordering, so the schema is applied once more
+        df = pl.DataFrame(data=rows, schema=PITCH_SCHEMA, orient='row', strict=False).cast(PITCH_SCHEMA)
 
         return df
 
-    def get_players(self,sport_id:int):
-        player_data = requests.get(url=f'https://statsapi.mlb.com/api/v1/sports/{sport_id}/players').json()
-
-        #Select relevant data that will help distinguish players from one another
-        fullName_list = [x['fullName'] for x in player_data['people']]
-        id_list = [x['id'] for x in player_data['people']]
-        position_list = [x['primaryPosition']['abbreviation'] for x in player_data['people']]
-        team_list = [x['currentTeam']['id']for x in player_data['people']]
-        age_list = [x['currentAge']for x in player_data['people']]
-
-        player_df = pl.DataFrame(data={'player_id':id_list,
-                        'name':fullName_list,
-                        'position':position_list,
-                        'team':team_list,
-                        'age':age_list})
-        return player_df
-    
     def get_teams(self):
         """
         Retrieves information about MLB teams from the MLB API and processes it into a Polars DataFrame.
         
         Returns:
-        - mlb_teams_df (pl.DataFrame): A DataFrame containing team information, including team ID, city, name, franchise, abbreviation, parent organization ID, parent organization name, league ID, and league name.
+        - mlb_teams_df (pl.DataFrame): A DataFrame containing team information, including team ID, city, name, franchise, abbreviation, parent organization ID, parent organization name, league ID, league name, and sport ID.
         """
         # Make API call to retrieve team information
-        teams = requests.get(url='https://statsapi.mlb.com/api/v1/teams/').json()
+        teams = self.session.get(url='https://statsapi.mlb.com/api/v1/teams/', timeout=self.timeout).json()
 
         # Extract relevant data from the API response
         mlb_teams_city = [x['franchiseName'] if 'franchiseName' in x else None for x in teams['teams']]
@@ -750,6 +1353,7 @@ class MLB_Scrape:
         mlb_teams_parent = [x['parentOrgName'] if 'parentOrgName' in x else None for x in teams['teams']]
         mlb_teams_league_id = [x['league']['id'] if 'id' in x['league'] else None for x in teams['teams']]
         mlb_teams_league_name = [x['league']['name'] if 'name' in x['league'] else None for x in teams['teams']]
+        mlb_teams_sport_id = [x['sport']['id'] if 'sport' in x else None for x in teams['teams']]
 
         # Create a Polars DataFrame with the extracted data
         mlb_teams_df = pl.DataFrame(data={'team_id': mlb_teams_id,
@@ -760,7 +1364,8 @@ class MLB_Scrape:
                                         'parent_org_id': mlb_teams_parent_id,
                                         'parent_org': mlb_teams_parent,
                                         'league_id': mlb_teams_league_id,
-                                        'league_name': mlb_teams_league_name
+                                        'league_name': mlb_teams_league_name,
+                                        'sport_id': mlb_teams_sport_id
                                         }).unique().drop_nulls(subset=['team_id']).sort('team_id')
 
         # Fill missing parent organization IDs with team IDs
@@ -791,6 +1396,27 @@ class MLB_Scrape:
 
         return mlb_teams_df
 
+    def get_team_directory(self, refresh: bool = False):
+        """
+        Retrieves every team keyed by team ID, built once from get_teams and refreshed after team_ttl seconds.
+
+        Parameters:
+        - refresh (bool): Whether to download the teams again even if the directory is fresh. Default is False.
+
+        Returns:
+        - team_directory (dict): The get_teams row of each team as a dict, keyed by team ID.
+        """
+        directory = self._team_directory
+        if directory is not None and not refresh and time.time() - directory['time'] < self.team_ttl:
+            return directory['teams']
+
+        def build():
+            teams = {row['team_id']: row for row in self.get_teams().to_dicts()}
+            self._team_directory = {'time': time.time(), 'teams': teams}
+            return teams
+
+        return self._flight.do('teams', build)
+
     def get_leagues(self):
         """
         Retrieves information about MLB leagues from the MLB API and processes it into a Polars DataFrame.
@@ -799,7 +1425,7 @@ class MLB_Scrape:
         - leagues_df (pl.DataFrame): A DataFrame containing league information, including league ID, league name, league abbreviation, and sport ID.
         """
         # Make API call to retrieve league information
-        leagues = requests.get(url='https://statsapi.mlb.com/api/v1/leagues/').json()
+        leagues = self.session.get(url='https://statsapi.mlb.com/api/v1/leagues/', timeout=self.timeout).json()
 
         # Extract relevant data from the API response
         sport_id = [x['sport']['id'] if 'sport' in x else None for x in leagues['leagues']]
@@ -850,7 +1476,7 @@ class MLB_Scrape:
         game_type_str = ','.join([str(x) for x in game_type])
 
         # Make API call to retrieve player game logs
-        response = requests.get(url=f'http://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=stats(type=gameLog,season={season},startDate={start_date},endDate={end_date},sportId={sport_id},gameType=[{game_type_str}]),hydrations').json()
+        response = self.session.get(url=f'https://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=stats(type=gameLog,season={season},startDate={start_date},endDate={end_date},sportId={sport_id},gameType=[{game_type_str}]),hydrations', timeout=self.timeout).json()
         
         # Extract game IDs from the API response
         player_game_list = [x['game']['gamePk'] for x in response['people'][0]['stats'][0]['splits']]
@@ -858,6 +1484,73 @@ class MLB_Scrape:
         return player_game_list
     
 
+    def get_player_directory(self, sport_id: int):
+        """
+        Retrieves the roster of a league from the player directory, revalidating it with the API once its TTL has passed.
+
+        Parameters:
+        - sport_id (int): The ID of the sport for which to retrieve player data.
+
+        Returns:
+        - entry (dict): The directory entry, holding player_df, pitcher_df (pitchers only, with a pitcher_name_id column) and pitcher_name_id_dict.
+        """
+        entry = self.player_directory.get(sport_id)
+        if entry is not None and self.player_directory.is_fresh(entry):
+            return entry
+        return self._flight.do(('players', sport_id), lambda: self._refresh_player_directory(sport_id, entry))
+
+    def _refresh_player_directory(self, sport_id: int, entry: dict):
+
+        # Ask for the roster only if it changed since the cached copy was downloaded
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.session.get(url=f'https://statsapi.mlb.com/api/v1/sports/{sport_id}/players', headers=headers, timeout=self.timeout)
+        if entry is not None and response.status_code == 304:
+            self.player_directory.touch(sport_id)
+            return entry
+        response.raise_for_status()
+
+        return self.player_directory.put(sport_id,
+                                         response.json()['people'],
+                                         etag=response.headers.get('ETag'),
+                                         last_modified=response.headers.get('Last-Modified'))
+
+    def get_player_metadata(self, player_ids: list):
+        """
+        Retrieves the bio and current team of players, requesting every player not cached within metadata_ttl seconds in one call.
+
+        Parameters:
+        - player_ids (list): The IDs of the players.
+
+        Returns:
+        - players (dict): The people endpoint record of each player, hydrated with the current team and keyed by player ID.
+        """
+        player_ids = [int(x) for x in player_ids]
+        now = time.time()
+        with self._lock:
+            missing_ids = [x for x in dict.fromkeys(player_ids) if x not in self._player_metadata or now - self._player_metadata[x][0] >= self.metadata_ttl]
+
+        if len(missing_ids) > 0:
+            def fetch():
+                # Request every missing player at once
+                person_ids_str = ','.join([str(x) for x in missing_ids])
+                response = self.session.get(url=f'https://statsapi.mlb.com/api/v1/people?personIds={person_ids_str}&hydrate=currentTeam', timeout=self.timeout)
+                response.raise_for_status()
+                fetched = time.time()
+                with self._lock:
+                    for person in response.json()['people']:
+                        self._player_metadata[person['id']] = (fetched, person)
+
+            self._flight.do(('people', tuple(missing_ids)), fetch)
+
+        with self._lock:
+            return {x: self._player_metadata[x][1] for x in player_ids if x in self._player_metadata}
+
     def get_players(self, sport_id: int):
         """
         Retrieves data frame of players in a given league
@@ -868,35 +1561,312 @@ class MLB_Scrape:
         Returns:
         - player_df (pl.DataFrame): A DataFrame containing player information, including player ID, name, position, team, and age.
         """
-    
-        player_data = requests.get(url=f'https://statsapi.mlb.com/api/v1/sports/{sport_id}/players').json()
-
-        #Select relevant data that will help distinguish players from one another
-
-        fullName_list = [x['fullName'] for x in player_data['people']]
-        firstName_list = [x['firstName'] for x in player_data['people']]
-        lastName_list = [x['lastName'] for x in player_data['people']]
-        id_list = [x['id'] for x in player_data['people']]
-        position_list = [x['primaryPosition']['abbreviation'] for x in player_data['people']]
-        team_list = [x['currentTeam']['id']for x in player_data['people']]
-        weight_list = [x['weight'] for x in player_data['people']]
-        height_list = [x['height'] for x in player_data['people']]
-        age_list = [x['currentAge']for x in player_data['people']]
-        birthDate_list = [x['birthDate']for x in player_data['people']]
-
-
-
-
-        df = pl.DataFrame(data={'player_id':id_list,
-                                        'first_name':firstName_list,
-                                        'last_name':lastName_list,
-                                        'name':fullName_list,
-                                        'position':position_list,
-                                        'team':team_list,
-                                        'weight':weight_list,
-                                        'height':height_list,
-                                        'age':age_list,
-                                        'birthDate':birthDate_list})
-              
-        return df
+        return self.get_player_directory(sport_id)['player_df']
+
+
+class SharedPitchStore:
+
+    def __init__(self, scraper: MLB_Scrape, max_bytes: int = 1024 ** 3):
+        """
+        Process-wide store of finished games' pitch data, shared by every session so each game is downloaded and held once.
+        Each game is kept sorted by pitcher, so a pitcher's pitches are handed out as zero-copy slices of it.
+
+        Parameters:
+        - scraper (MLB_Scrape): The scraper pitch data is fetched with.
+        - max_bytes (int): The memory budget of the stored games. Least recently used games no session references are evicted beyond it. Default is 1 GB.
+        """
+        self.scraper = scraper
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._games = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def pitcher_games(self, game_list_input: list, pitcher_id: int, sport_id: int):
+        """
+        Retrieves a pitcher's pitches in each of a list of games, fetching the games not stored yet.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs.
+        - pitcher_id (int): The ID of the pitcher.
+        - sport_id (int): The sport ID the games were played in.
+
+        Returns:
+        - games (dict): The game date and a zero-copy slice of the pitcher's pitches, keyed by the IDs of the finished games.
+          Each of them is acquired for the caller, who must release it.
+        - live_df (pl.DataFrame): The pitcher's pitches in games still in progress, which are not stored.
+        """
+        with self._lock:
+            missing_games = [game_id for game_id in game_list_input if game_id not in self._games]
+            self.hits += len(game_list_input) - len(missing_games)
+            self.misses += len(missing_games)
+
+        live_frames = [pl.DataFrame(schema=PITCH_SCHEMA)]
+        if len(missing_games) > 0:
+            data_df = self.scraper.get_pitch_data(game_list_input=missing_games, sport_id=sport_id)
+            for (game_id,), game_df in data_df.partition_by('game_id', as_dict=True).items():
+                # Games still in progress are not stored so they are fetched again next time
+                if game_id not in self.scraper._final_games:
+                    live_frames.append(game_df.filter(pl.col('pitcher_id') == pitcher_id))
+                    continue
+
+                # Sort the game by pitcher and record where each pitcher's rows start and how many there are
+                game_df = game_df.sort('pitcher_id', maintain_order=True).rechunk()
+                counts = game_df.group_by('pitcher_id', maintain_order=True).len()
+                offsets = np.concatenate([[0], np.cumsum(counts['len'].to_numpy())[:-1]])
+                index = {pid: (int(offset), int(n)) for pid, offset, n in zip(counts['pitcher_id'].to_list(), offsets, counts['len'].to_list())}
+
+                entry = {'game_date': game_df['game_date'][0], 'df': game_df, 'index': index, 'refs': 0, 'bytes': game_df.estimated_size()}
+                with self._lock:
+                    if game_id not in self._games:
+                        self._games[game_id] = entry
+                        self._size += entry['bytes']
+
+        games = {}
+        with self._lock:
+            for game_id in game_list_input:
+                entry = self._games.get(game_id)
+                if entry is None:
+                    continue
+                # Pin the game before evicting, so the games handed out cannot be evicted in between
+                entry['refs'] += 1
+                self._games.move_to_end(game_id)
+                offset, n = entry['index'].get(pitcher_id, (0, 0))
+                games[game_id] = (entry['game_date'], entry['df'].slice(offset, n))
+            self._evict()
+
+        return games, pl.concat(live_frames, how='vertical_relaxed')
+
+    def acquire(self, game_ids: list):
+        """
+        Records that a session holds slices of games, keeping them from being evicted.
+
+        Parameters:
+        - game_ids (list): The game IDs the session now holds.
+        """
+        with self._lock:
+            for game_id in game_ids:
+                if game_id in self._games:
+                    self._games[game_id]['refs'] += 1
+
+    def release(self, game_ids: list):
+        """
+        Records that a session no longer holds slices of games.
+
+        Parameters:
+        - game_ids (list): The game IDs the session let go of.
+        """
+        with self._lock:
+            for game_id in game_ids:
+                if game_id in self._games:
+                    self._games[game_id]['refs'] -= 1
+            self._evict()
+
+    def _evict(self):
+        # Remove the least recently used games no session holds until the store fits within max_bytes
+        for game_id in [game_id for game_id, entry in self._games.items() if entry['refs'] <= 0]:
+            if self._size <= self.max_bytes:
+                break
+            self._size -= self._games.pop(game_id)['bytes']
+            self.evictions += 1
+
+    def refcounts(self):
+        """
+        Reports how many sessions hold each stored game.
+
+        Returns:
+        - refcounts (dict): The number of sessions holding each game, keyed by game ID.
+        """
+        with self._lock:
+            return {game_id: entry['refs'] for game_id, entry in self._games.items()}
+
+    def stats(self):
+        """
+        Reports the store's counters.
+
+        Returns:
+        - stats (dict): The number of game hits, misses and evictions, the stored and referenced games, the total references, and the estimated resident bytes.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'games': len(self._games),
+                    'referenced_games': sum(entry['refs'] > 0 for entry in self._games.values()),
+                    'references': sum(entry['refs'] for entry in self._games.values()),
+                    'bytes': self._size}
+
+
+class PitchDataCache:
+
+    def __init__(self, scraper: MLB_Scrape, max_bytes: int = 256 * 1024 ** 2, shared_store: SharedPitchStore = None):
+        """
+        In-memory cache of a pitcher's per-game pitch data, keyed by (sport_id, pitcher_id, season). A date range
+        inside the ranges already fetched is sliced from memory, a wider one only fetches the games not held yet.
+
+        Parameters:
+        - scraper (MLB_Scrape): The scraper game lists and pitch data are fetched with.
+        - max_bytes (int): The memory budget of the cached frames. Least recently used pitchers are evicted beyond it. Default is 256 MB.
+        - shared_store (SharedPitchStore): An optional process-wide store games are taken from as zero-copy slices instead of being held by this cache alone. Default is None.
+        """
+        self.scraper = scraper
+        self.max_bytes = max_bytes
+        self.shared_store = shared_store
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        # Number of cached pitchers holding each game, the shared store is told when a game is first held and last released
+        self._held = {}
+        if self.shared_store is not None:
+            weakref.finalize(self, self._release_all, self.shared_store, self._held)
+
+    @staticmethod
+    def _release_all(shared_store: SharedPitchStore, held: dict):
+        # Hand every game back to the shared store once the cache itself is garbage collected
+        shared_store.release([game_id for game_id, n in held.items() if n > 0])
+        held.clear()
+
+    def _hold(self, game_ids: list):
+        # Count the games a newly cached pitcher holds. The shared store acquired each of them when it handed them out,
+        # so the ones another cached pitcher already held are released again
+        held_before = []
+        for game_id in game_ids:
+            self._held[game_id] = self._held.get(game_id, 0) + 1
+            if self._held[game_id] > 1:
+                held_before.append(game_id)
+        if self.shared_store is not None:
+            self.shared_store.release(held_before)
+
+    def _unhold(self, game_ids: list):
+        # Count the games an evicted pitcher held, releasing the ones no other pitcher holds
+        last = []
+        for game_id in game_ids:
+            self._held[game_id] -= 1
+            if self._held[game_id] == 0:
+                del self._held[game_id]
+                last.append(game_id)
+        if self.shared_store is not None:
+            self.shared_store.release(last)
+
+    def _fetch(self, game_list_input: list, pitcher_id: int, sport_id: int):
+        # Take the games from the shared store when there is one, otherwise fetch and filter them here
+        if self.shared_store is not None:
+            return self.shared_store.pitcher_games(game_list_input, pitcher_id, sport_id)
+
+        data_df = self.scraper.get_pitch_data(game_list_input=game_list_input, sport_id=sport_id)
+        data_df = data_df.filter(pl.col('pitcher_id') == pitcher_id)
+
+        games = {}
+        for (game_id,), game_df in data_df.partition_by('game_id', as_dict=True).items():
+            # Games still in progress are left out so they are fetched again next time
+            if game_id in self.scraper._final_games:
+                games[game_id] = (game_df['game_date'][0], game_df)
+        return games, data_df.filter(~pl.col('game_id').is_in(list(games)))
+
+    def _covered(self, ranges: list, start: date, end: date):
+        # A range is answered from memory if a single fetched range contains it
+        return any(s <= start and end <= e for s, e in ranges)
+
+    def _add_range(self, ranges: list, start: date, end: date):
+        # Merge the new range with every fetched range it overlaps or touches
+        ranges = sorted(ranges + [(start, end)])
+        merged = [ranges[0]]
+        for s, e in ranges[1:]:
+            if s <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+            else:
+                merged.append((s, e))
+        return merged
+
+    def get(self, sport_id: int, pitcher_id: int, start_date: str, end_date: str, game_type: list = ['R']):
+        """
+        Retrieves a pitcher's pitch data between two dates.
+
+        Parameters:
+        - sport_id (int): The sport ID the games were played in.
+        - pitcher_id (int): The ID of the pitcher.
+        - start_date (str): The start date (YYYY-MM-DD) of the range. Its year is the season looked up.
+        - end_date (str): The end date (YYYY-MM-DD) of the range.
+        - game_type (list): A list of game types to include. Default is ['R'].
 
+        Returns:
+        - data_df (pl.DataFrame): The pitcher's pitches in games played between the two dates.
+        """
+        start = date.fromisoformat(str(start_date))
+        end = date.fromisoformat(str(end_date))
+        key = (sport_id, pitcher_id, start.year, tuple(game_type))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                covered = self._covered(entry['ranges'], start, end)
+            else:
+                entry = {'games': {}, 'ranges': [], 'bytes': 0}
+                covered = False
+
+            if covered:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        live_df = None
+        if not covered:
+            # List the games in the range and only fetch the ones not cached yet
+            game_list = self.scraper.get_player_games_list(player_id=pitcher_id, season=start.year,
+                                                           start_date=str(start), end_date=str(end),
+                                                           sport_id=sport_id, game_type=game_type)
+            missing_games = [game_id for game_id in game_list if game_id not in entry['games']]
+            fetched, live_df = self._fetch(missing_games, pitcher_id, sport_id)
+            games = dict(entry['games'])
+            games.update(fetched)
+
+            # The range only counts as fetched once every game in it is final and cached
+            ranges = entry['ranges']
+            if all(game_id in games for game_id in game_list):
+                ranges = self._add_range(ranges, start, end)
+
+            new_entry = {'games': games, 'ranges': ranges, 'bytes': sum(df.estimated_size() for _, df in games.values())}
+            with self._lock:
+                old_entry = self._entries.pop(key, None)
+                self._size -= old_entry['bytes'] if old_entry is not None else 0
+                self._entries[key] = new_entry
+                self._size += new_entry['bytes']
+                self._hold(list(fetched))
+                self._evict()
+            entry = new_entry
+
+        frames = [df for game_date, df in entry['games'].values() if start <= game_date <= end]
+        if live_df is not None and len(live_df) > 0:
+            frames.append(live_df)
+        if len(frames) == 0:
+            return pl.DataFrame(schema=PITCH_SCHEMA)
+        return pl.concat(frames, how='vertical_relaxed')
+
+    def _evict(self):
+        # Drop the least recently used pitchers until the cache fits within max_bytes, always keeping the newest
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry['bytes']
+            self._unhold(list(entry['games']))
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Reports the cache's counters.
+
+        Returns:
+        - stats (dict): The number of hits, misses, evictions, cached pitchers, and estimated bytes held.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'pitchers': len(self._entries),
+                    'bytes': self._size}
@@ -5,6 +5,7 @@ import PitchPlotFunctions as ppf
 import requests
 import polars as pl
 from datetime import date
+import threading
 import api_scraper
 
 
@@ -28,10 +29,30 @@ It can also display data for games currently in progress.
 """
 )
 
-# Initialize the plotter object from PitchPlotFunctions
-ploter = ppf.PitchPlotFunctions()
-# Initialize the scraper object
-scraper = api_scraper.MLB_Scrape()
+# Initialize the scraper object once per server process so its caches outlive each rerun
+@st.cache_resource
+def get_scraper():
+    return api_scraper.MLB_Scrape(feed_store=api_scraper.FeedStore(),
+                                  pitch_store=api_scraper.PitchStore(),
+                                  player_directory=api_scraper.PlayerDirectory())
+
+scraper = get_scraper()
+
+# Share finished games' pitch data across every session of the server process
+@st.cache_resource
+def get_shared_store():
+    return api_scraper.SharedPitchStore(scraper)
+
+shared_store = get_shared_store()
+# Initialize the plotter object from PitchPlotFunctions once per server process, sharing the scraper's HTTP session,
+# and load the team logos into its image cache in the background
+@st.cache_resource
+def get_ploter():
+    ploter = ppf.PitchPlotFunctions(scraper=scraper, image_cache=ppf.ImageCache(scraper))
+    threading.Thread(target=ploter.prewarm_logos, daemon=True).start()
+    return ploter
+
+ploter = get_ploter()
 
 # Dictionary mapping league names to sport IDs
 sport_id_dict = {'MLB': 1, 'AAA': 11}
@@ -45,34 +66,17 @@ with col_1:
     selected_sport_id = sport_id_dict[selected_league]
 
 with col_2:
-    # Get player data and filter for pitchers
-    df_player = scraper.get_players(sport_id=selected_sport_id)
-    df_player = df_player.filter(pl.col('position').str.contains('P'))
-    df_player = df_player.with_columns(
-        (pl.concat_str(["name", "player_id"], separator=" - ").alias("pitcher_name_id"))
-    )
-    
-    # Select specific columns and convert to dictionary
-    pitcher_name_id_dict = dict(df_player.select(['pitcher_name_id', 'player_id']).iter_rows())
-    
-    # Initialize session state for previous selection
-    if 'prev_pitcher_id' not in st.session_state:
-        st.session_state.prev_pitcher_id = None
+    # Get the pitchers of the league from the cached player directory
+    pitcher_name_id_dict = scraper.get_player_directory(sport_id=selected_sport_id)['pitcher_name_id_dict']
     
     # Display a selectbox for pitcher selection
     selected_pitcher = st.selectbox("##### Select Pitcher", list(pitcher_name_id_dict.keys()))
     pitcher_id = pitcher_name_id_dict[selected_pitcher]
 
-# Clear cache if selection changes
-if pitcher_id != st.session_state.prev_pitcher_id:
-    st.cache_data.clear()
-    st.session_state.prev_pitcher_id = pitcher_id
-    st.session_state.cache_cleared = False
-    st.write('Cache cleared!')
-
-# Initialize session state for cache status
-if 'cache_cleared' not in st.session_state:
-    st.session_state.cache_cleared = False
+# Keep each session's pitch data cached per pitcher, so switching back to a pitcher does not refetch it.
+# The frames are slices of the shared store's games, so sessions viewing the same games do not copy them.
+if 'pitch_cache' not in st.session_state:
+    st.session_state.pitch_cache = api_scraper.PitchDataCache(scraper, shared_store=shared_store)
 
 # Dictionary for batter hand selection
 batter_hand_picker = {
@@ -118,48 +122,83 @@ plot_picker_dict = {
 plot_picker_select = st.selectbox('Select Plot Type:', list(plot_picker_dict.keys()))
 plot_picker = plot_picker_dict[plot_picker_select]
 
-# Extract season from start date
-season = str(start_date)[0:4]
-
-# Get list of games for the selected player and date range
-player_games = scraper.get_player_games_list(player_id=pitcher_id, season=season,
-                                             start_date=str(start_date), end_date=str(end_date),
-                                             sport_id=selected_sport_id,
-                                             game_type = ['R','P'])
-
-# Function to fetch data and cache it
-@st.cache_data
-def fetch_data():
-    data = scraper.get_data(game_list_input=player_games)
-    df = scraper.get_data_df(data_list=data)
-    return df
-
-# Fetch data and manage cache status
-if not st.session_state.cache_cleared:
-    df_original = fetch_data()
-    st.session_state.cache_cleared = True
-else:
-    df_original = fetch_data()
-
-# Button to generate plot
+# Toggle for the full resolution plot, a quick preview is shown otherwise
+high_resolution = st.toggle('High Resolution', value=False)
+
+# Recompute a stage of the app only when its inputs changed since the rerun that last computed it
+def memo_stage(name, inputs, compute):
+    stage = st.session_state.get(f'stage_{name}')
+    if stage is None or stage['inputs'] != inputs:
+        stage = {'inputs': inputs, 'value': compute()}
+        st.session_state[f'stage_{name}'] = stage
+    return stage['value']
+
+# Button to generate plot, nothing is fetched until it has been pressed
 if st.button('Generate Plot'):
+    st.session_state.plot_request = {'sport_id': selected_sport_id,
+                                     'league': selected_league,
+                                     'pitcher_id': pitcher_id,
+                                     'pitcher_name': selected_pitcher,
+                                     'start_date': str(start_date),
+                                     'end_date': str(end_date)}
+
+# The league, pitcher and dates of the last request pick the data, batter hand and plot type apply to it as they change
+plot_request = st.session_state.get('plot_request')
+if plot_request is not None:
     try:
+        data_key = tuple(plot_request.values())
+
+        # Fetch the pitch data for the requested pitcher and date range
+        df_original = memo_stage('pitch_data', data_key,
+                                 lambda: st.session_state.pitch_cache.get(sport_id=plot_request['sport_id'],
+                                                                          pitcher_id=plot_request['pitcher_id'],
+                                                                          start_date=plot_request['start_date'],
+                                                                          end_date=plot_request['end_date'],
+                                                                          game_type=['R','P']))
+
         # Convert dataframe to polars and filter based on inputs
-        df = ploter.df_to_polars(df_original=df_original,
-                                 pitcher_id=pitcher_id,
-                                 start_date=str(start_date),
-                                 end_date=str(end_date),
-                                 batter_hand=batter_hand)
-        print(df)
+        filter_key = (data_key, tuple(batter_hand))
+        df = memo_stage('filtered', filter_key,
+                        lambda: ploter.df_to_polars(df_original=df_original,
+                                                    pitcher_id=plot_request['pitcher_id'],
+                                                    start_date=plot_request['start_date'],
+                                                    end_date=plot_request['end_date'],
+                                                    batter_hand=batter_hand))
         if len(df) == 0:
             st.write('Please select different parameters.')
         else:
-            # Generate the final plot
-            ploter.final_plot(
-                df=df,
-                pitcher_id=pitcher_id,
-                plot_picker=plot_picker,
-                sport_id=selected_sport_id)
+            # Fetch the headshot, bio and logo once per pitcher, in the background while the figure is drawn.
+            # A fetch that failed is started again rather than kept for the rest of the session.
+            header_stage = st.session_state.get('stage_header')
+            if header_stage is not None and any(f.done() and f.exception() is not None for f in header_stage['value'].values()):
+                del st.session_state['stage_header']
+            assets = memo_stage('header', (plot_request['pitcher_id'], plot_request['sport_id']),
+                                lambda: ploter.start_header_assets(pitcher_id=plot_request['pitcher_id'], sport_id=plot_request['sport_id']))
+
+            # Generate the final plot, served from the process-wide figure cache when the same plot of the same data was rendered before
+            def render(quality):
+                return ploter.render_png(df=df,
+                                         pitcher_id=plot_request['pitcher_id'],
+                                         plot_picker=plot_picker,
+                                         sport_id=plot_request['sport_id'],
+                                         assets=assets,
+                                         quality=quality)
+
+            # Show a fast preview straight away and swap in the full resolution plot only when it is asked for
+            figure_key = (filter_key, plot_picker)
+            plot_placeholder = st.empty()
+            plot_placeholder.image(memo_stage('figure_preview', figure_key, lambda: render('preview')), use_column_width=True)
+            if high_resolution:
+                plot_placeholder.image(memo_stage('figure_screen', figure_key, lambda: render('screen')), use_column_width=True)
+
+            # Render the print quality plot only for a download
+            if st.button('Prepare Print Quality Download'):
+                st.session_state.print_key = figure_key
+            if st.session_state.get('print_key') == figure_key:
+                st.download_button('Download Plot',
+                                   data=memo_stage('figure_print', figure_key, lambda: render('print')),
+                                   file_name=f"{plot_request['pitcher_id']}_{plot_picker}.png",
+                                   mime='image/png')
             
             # Use a container to control the width of the AgGrid display
             with st.container():
@@ -168,13 +207,13 @@ if st.button('Generate Plot'):
                     df.group_by(['pitcher_id', 'pitch_description'])
                     .agg([
                         pl.col('is_pitch').drop_nans().count().alias('pitches'),
-                        pl.col('start_speed').drop_nans().mean().round(1).alias('start_speed'),
-                        pl.col('vb').drop_nans().mean().round(1).alias('vb'),
-                        pl.col('ivb').drop_nans().mean().round(1).alias('ivb'),
-                        pl.col('hb').drop_nans().mean().round(1).alias('hb'),
-                        pl.col('spin_rate').drop_nans().mean().round(0).alias('spin_rate'),
-                        pl.col('x0').drop_nans().mean().round(1).alias('x0'),
-                        pl.col('z0').drop_nans().mean().round(1).alias('z0'),
+                        pl.col('start_speed').drop_nans().mean().cast(pl.Float64).round(1).alias('start_speed'),
+                        pl.col('vb').drop_nans().mean().cast(pl.Float64).round(1).alias('vb'),
+                        pl.col('ivb').drop_nans().mean().cast(pl.Float64).round(1).alias('ivb'),
+                        pl.col('hb').drop_nans().mean().cast(pl.Float64).round(1).alias('hb'),
+                        pl.col('spin_rate').drop_nans().mean().cast(pl.Float64).round(0).alias('spin_rate'),
+                        pl.col('x0').drop_nans().mean().cast(pl.Float64).round(1).alias('x0'),
+                        pl.col('z0').drop_nans().mean().cast(pl.Float64).round(1).alias('z0'),
                     ])
                     .with_columns(
                         (pl.col('pitches') / pl.col('pitches').sum().over('pitcher_id') * 100).round(3).alias('proportion')
@@ -196,7 +235,7 @@ if st.button('Generate Plot'):
                     'z0': 'vRel',
                 }
 
-                st.markdown(f"""##### {selected_pitcher.split('-')[0]} {selected_league} Pitch Data""")
+                st.markdown(f"""##### {plot_request['pitcher_name'].split('-')[0]} {plot_request['league']} Pitch Data""")
                 st.dataframe(grouped_df,
                              hide_index=True,
                              column_config=column_config_dict,
@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import time
+import api_scraper
+
+
+def load_checkpoint(path: str):
+    """
+    Loads the set of game IDs a previous run has already finished.
+
+    Parameters:
+    - path (str): The checkpoint file.
+
+    Returns:
+    - done (set): The finished game IDs, empty if there is no checkpoint yet.
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return set(json.load(f)['done'])
+
+
+def save_checkpoint(path: str, done: set):
+    """
+    Writes the set of finished game IDs, replacing the previous checkpoint atomically.
+
+    Parameters:
+    - path (str): The checkpoint file.
+    - done (set): The finished game IDs.
+    """
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'done': sorted(done)}, f)
+    os.replace(tmp_path, path)
+
+
+def backfill(season: int, sport_ids: list, store_path: str = 'pitch_store', checkpoint_path: str = 'backfill_checkpoint.json',
+             max_workers: int = 8, game_type: list = ['R'], checkpoint_every: int = 10):
+    """
+    Downloads and flattens every finished game of a season into a local pitch store, resuming from the checkpoint of an earlier run.
+
+    Parameters:
+    - season (int): The season to backfill.
+    - sport_ids (list): The sport IDs to backfill.
+    - store_path (str): The root directory of the pitch store. Default is 'pitch_store'.
+    - checkpoint_path (str): The file recording finished games. Default is 'backfill_checkpoint.json'.
+    - max_workers (int): The maximum number of games downloaded and converted concurrently. Default is 8.
+    - game_type (list): A list of game types to backfill. Default is ['R'].
+    - checkpoint_every (int): The number of games between checkpoint writes. Default is 10.
+
+    Returns:
+    - stats (dict): The number of games and pitches written, the elapsed seconds, and the failed game IDs.
+    """
+    scraper = api_scraper.MLB_Scrape(pitch_store=api_scraper.PitchStore(store_path), pool_size=max_workers)
+    done = load_checkpoint(checkpoint_path)
+    games_written = 0
+    pitches_written = 0
+    failed_games = {}
+    start = time.perf_counter()
+
+    for sport_id in sport_ids:
+        schedule = scraper.get_schedule(year_input=[season], sport_id=[sport_id], game_type=game_type)
+        if isinstance(schedule, str):
+            print(f'sport_id {sport_id}: {schedule}')
+            continue
+
+        # Only finished games are final enough to store, anything already done is skipped
+        game_list = [game_id for game_id in schedule.filter(schedule['state'].is_in(['F', 'O']))['game_id'].to_list() if game_id not in done]
+        print(f'sport_id {sport_id}: {len(game_list)} game(s) left to backfill')
+
+        games = scraper.iter_data_df(game_list, max_workers=max_workers, with_game_id=True, failed_games=failed_games)
+        for n, (game_id, data_df) in enumerate(games, start=1):
+            if len(data_df) > 0:
+                scraper.pitch_store.upsert(data_df, sport_id=sport_id)
+            done.add(game_id)
+            games_written += 1
+            pitches_written += len(data_df)
+
+            if n % checkpoint_every == 0:
+                save_checkpoint(checkpoint_path, done)
+
+        save_checkpoint(checkpoint_path, done)
+
+    elapsed = time.perf_counter() - start
+    print(f'Backfilled {games_written} game(s) and {pitches_written} pitch(es) in {elapsed:.1f}s: '
+          f'{games_written / elapsed * 60 if elapsed else 0:.1f} games/min, {pitches_written / elapsed if elapsed else 0:.1f} pitches/sec')
+
+    return {'games': games_written,
+            'pitches': pitches_written,
+            'seconds': elapsed,
+            'failed_games': failed_games}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Backfill every finished game of a season into the local pitch store.')
+    parser.add_argument('--season', type=int, required=True, help='The season to backfill.')
+    parser.add_argument('--sport-id', type=int, nargs='+', default=[1], help='The sport IDs to backfill. Default is 1.')
+    parser.add_argument('--game-type', nargs='+', default=['R'], help='The game types to backfill. Default is R.')
+    parser.add_argument('--store', default='pitch_store', help='The root directory of the pitch store. Default is pitch_store.')
+    parser.add_argument('--checkpoint', default='backfill_checkpoint.json', help='The file recording finished games. Default is backfill_checkpoint.json.')
+    parser.add_argument('--workers', type=int, default=8, help='The number of games downloaded concurrently. Default is 8.')
+    args = parser.parse_args()
+
+    stats = backfill(season=args.season,
+                     sport_ids=args.sport_id,
+                     store_path=args.store,
+                     checkpoint_path=args.checkpoint,
+                     max_workers=args.workers,
+                     game_type=args.game_type)
+    if stats['failed_games']:
+        print(f"Failed game(s), rerun to retry: {list(stats['failed_games'].keys())}")
@@ -0,0 +1,65 @@
+# Benchmark of the fixed per-plot cost, comparing build_plot and a screen quality render on a single pitch against a full frame.
+# Header assets are synthetic, so the MLB image CDN is not needed. The first build of each plot type also lays out its template.
+# Like timeit, garbage is collected before each run and the collector is off while it is timed.
+# Run from the repository root with: python tests/bench_build_plot.py [--games 40] [--repeat 5]
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import api_scraper
+import PitchPlotFunctions as ppf
+from synthetic import many_feeds, header_assets
+
+PLOT_TYPES = ['short_form_movement', 'long_form_movement', 'release_point']
+
+
+def timed(fn):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    # Clearing a figure resets every axis, which costs more than building it, so it is left out of the timing
+    if hasattr(result, 'clear'):
+        result.clear()
+    return elapsed
+
+
+def median_of(repeat, fn):
+    times = sorted(timed(fn) for _ in range(repeat))
+    return times[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--games', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    scraper = api_scraper.MLB_Scrape()
+    ploter = ppf.PitchPlotFunctions(scraper=scraper, image_cache=ppf.ImageCache(scraper, path=tempfile.mkdtemp()))
+    full = ploter.df_to_polars(scraper.get_data_df(many_feeds(args.games)), 500, '2024-01-01', '2024-12-31', ['L', 'R'])
+    frames = {'1 pitch': full.head(1), f'{len(full)} pitches': full}
+    assets = header_assets()
+
+    print('plot type            frame         first build (s)  build_plot (s)  render screen (s)')
+    for plot_picker in PLOT_TYPES:
+        for label, df in frames.items():
+            first = timed(lambda: ploter.build_plot(df, 500, plot_picker, 1, assets=assets))
+            build = median_of(args.repeat, lambda: ploter.build_plot(df, 500, plot_picker, 1, assets=assets))
+            # render_figure draws and encodes without going through the figure cache
+            render = median_of(args.repeat, lambda: ploter.render_figure(df, 500, plot_picker, 1, assets=assets, dpi=ppf.RENDER_QUALITY['screen']))
+            print(f'{plot_picker:<20} {label:<13} {first:>15.3f}  {build:>14.3f}  {render:>17.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# Benchmark of MLB_Scrape.get_data_df, reporting pitches parsed per second on copies of the synthetic test feeds.
+# Run from the repository root with: python tests/bench_get_data_df.py [--games 1000] [--repeat 5]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import api_scraper
+from synthetic import many_feeds
+
+
+def best_of(repeat, fn):
+    # The fastest of several runs, the one least disturbed by the rest of the machine
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    scraper = api_scraper.MLB_Scrape()
+    feeds = many_feeds(args.games)
+
+    extract, _ = best_of(args.repeat, lambda: [row for feed in feeds for row in scraper._game_rows(feed)])
+    total, df = best_of(args.repeat, lambda: scraper._data_df(feeds))
+    pitches = len(df)
+
+    print(f'{args.games} games, {pitches} pitches, best of {args.repeat}')
+    print(f'row extraction: {extract:.3f}s, {pitches / extract:,.0f} pitches/s')
+    print(f'get_data_df:    {total:.3f}s, {pitches / total:,.0f} pitches/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# Benchmark of the pitch scatter, comparing the seaborn scatterplot the plots used to draw with against scatter_pitches.
+# Reports artist creation and canvas draw time on a 16x16in axis at 1k, 10k and 100k pitches.
+# Run from the repository root with: python tests/bench_scatter.py [--sizes 1000 10000 100000] [--repeat 3]
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import polars as pl
+import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import PitchPlotFunctions as ppf
+
+
+def pitches(ploter, n):
+    # n pitches of random types spread over the short form movement plot
+    rng = np.random.default_rng(0)
+    pitch_types = list(ploter.pitch_colours()[0])
+    return pl.DataFrame({'pitch_type': rng.choice(pitch_types, n),
+                         'hb': rng.uniform(-25, 25, n),
+                         'ivb': rng.uniform(-25, 25, n)}).with_columns(pl.col('pitch_type').cast(pl.Categorical))
+
+
+def draw_seaborn(ploter, df, ax):
+    dict_colour, dict_pitch = ploter.pitch_colours()
+    sns.scatterplot(ax=ax, x=df['hb'], y=df['ivb'], hue=df['pitch_type'].cast(pl.String), palette=dict_colour, ec='black', alpha=1, zorder=2, s=50)
+    ax.get_legend().remove()
+
+
+def draw_direct(ploter, df, ax):
+    ploter.scatter_pitches(df, ax, x='hb', y='ivb')
+
+
+def time_draw(draw, ploter, df, repeat):
+    # The fastest of several runs of creating the artists and of drawing the canvas
+    create, render = [], []
+    for _ in range(repeat):
+        fig = Figure(figsize=(16, 16))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        start = time.perf_counter()
+        draw(ploter, df, ax)
+        create.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        canvas.draw()
+        render.append(time.perf_counter() - start)
+    return min(create), min(render)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    ploter = ppf.PitchPlotFunctions(image_cache=ppf.ImageCache(path=tempfile.mkdtemp()))
+    print('pitches  path     create (s)  draw (s)')
+    for n in args.sizes:
+        df = pitches(ploter, n)
+        for name, draw in [('seaborn', draw_seaborn), ('direct', draw_direct)]:
+            create, render = time_draw(draw, ploter, df, args.repeat)
+            print(f'{n:>7}  {name:<7}  {create:>10.3f}  {render:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Benchmark of fetching 100 game feeds with the scraper's pooled session against a new connection per request.
+# By default the feeds are served gzip-compressed by a local keep-alive HTTP server, which only shows the TCP setup saved.
+# With --live the real feed/live endpoint is used, which also pays the TLS handshake. It needs network access.
+# Run from the repository root with: python tests/bench_session.py [--games 100] [--workers 8] [--live]
+import argparse
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import api_scraper
+from synthetic import load_feeds
+
+
+class NoPoolSession:
+    # Sends every request on a new connection, as the bare requests.get calls did
+    def get(self, url, **kwargs):
+        return requests.get(url, headers={'Accept-Encoding': 'gzip, deflate'}, **kwargs)
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which stalls on delayed ACKs once a connection is reused
+    disable_nagle_algorithm = True
+    body = None
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_feed():
+    # A local server answering every path with the first synthetic feed
+    FeedHandler.body = gzip.compress(json.dumps(load_feeds()[0]).encode())
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fetch_all(session, urls, workers):
+    # Fetch the feeds the way get_data does, with a bounded pool of workers
+    def fetch(url):
+        r = session.get(url, timeout=30)
+        r.raise_for_status()
+        return r.json()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch, urls))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--live', action='store_true')
+    args = parser.parse_args()
+
+    if args.live:
+        # The first games of the 2024 regular season
+        game_ids = api_scraper.MLB_Scrape().get_schedule(year_input=[2024], sport_id=[1], game_type=['R'])['game_id'].to_list()
+        urls = [f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live' for game_id in game_ids[:args.games]]
+    else:
+        server = serve_feed()
+        urls = [f'http://127.0.0.1:{server.server_address[1]}/api/v1.1/game/{game_id}/feed/live' for game_id in range(args.games)]
+
+    sessions = {'new connection per request': NoPoolSession(), 'pooled session': api_scraper.MLB_Scrape(pool_size=args.workers).session}
+    for workers in sorted({1, args.workers}):
+        for name, session in sessions.items():
+            start = time.perf_counter()
+            fetch_all(session, urls, workers)
+            print(f'{len(urls)} feeds, {workers} worker(s), {name}: {time.perf_counter() - start:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
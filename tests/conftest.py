@@ -0,0 +1,23 @@
+import os
+import sys
+import pytest
+
+# The modules live at the repository root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_addoption(parser):
+    parser.addoption('--run-slow', action='store_true', help='Also run the tests marked slow, such as the render soak test.')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: a long running soak or memory test, only run with --run-slow')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-slow'):
+        return
+    skip_slow = pytest.mark.skip(reason='slow, run with --run-slow')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
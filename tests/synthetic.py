@@ -0,0 +1,30 @@
+import copy
+import json
+import os
+import numpy as np
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def load_feeds():
+    # The synthetic game feeds of the golden get_data_df test
+    with open(os.path.join(DATA, 'feeds.json')) as f:
+        return json.load(f)
+
+
+def many_feeds(n_games: int):
+    # n_games copies of the synthetic feeds, each with its own gamePk
+    feeds = load_feeds()
+    games = []
+    for i in range(n_games):
+        feed = copy.deepcopy(feeds[i % len(feeds)])
+        feed['gamePk'] = 1000 + i
+        games.append(feed)
+    return games
+
+
+def header_assets():
+    # Stand-ins for the headshot, bio and logo, so plots render without the MLB image CDN
+    img = (np.random.default_rng(0).random((40, 40, 4)) * 255).astype(np.uint8)
+    player = {'fullName': 'Test Pitcher', 'pitchHand': {'code': 'R'}, 'currentAge': 30, 'height': "6' 2\"", 'weight': 200}
+    return {'headshot': img, 'player': player, 'logo': img}
@@ -0,0 +1,64 @@
+import json
+import os
+import polars as pl
+from polars.testing import assert_frame_equal
+import api_scraper
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def load_feeds():
+    # Three synthetic game feeds. The second has a pitch without a spin direction, one without pfxX,
+    # one without any pitchData and one without a pitch type. The third has two walks without a pitch.
+    with open(os.path.join(DATA, 'feeds.json')) as f:
+        return json.load(f)
+
+
+def test_get_data_df_matches_golden_output():
+    """
+    The per-game row extractor gives the same rows as the original column-list flattener.
+    The expected frame was written by get_data_df at commit de38fcd. That flattener filled missing values with NaN,
+    and 'NaN' in the string columns. They are mapped to null before applying the current schema.
+    """
+    df = api_scraper.MLB_Scrape().get_data_df(load_feeds())
+
+    expected = pl.read_parquet(os.path.join(DATA, 'get_data_df_expected.parquet'))
+    expected = expected.with_columns(pl.col(pl.Float64).fill_nan(None),
+                                     pl.col(pl.String).replace('NaN', None)).cast(api_scraper.PITCH_SCHEMA)
+
+    assert df.schema == api_scraper.PITCH_SCHEMA
+    assert_frame_equal(df, expected)
+
+
+def test_walk_without_a_pitch_keeps_its_old_columns():
+    """
+    A walk event without a pitch reports its count swapped and the batting side's team ID as pitcher_team_id,
+    as the original flattener did.
+    """
+    df = api_scraper.MLB_Scrape().get_data_df(load_feeds())
+    walks = df.filter(pl.col('event_type') == 'intent_walk', ~pl.col('is_pitch'))
+
+    assert len(walks) == 2
+    assert walks['pitcher_team_id'].to_list() == walks['batter_team_id'].to_list()
+    assert walks['strikes'].to_list() == [4, 4]
+    assert walks['balls'].to_list() == [0, 0]
+
+
+def test_get_data_df_is_the_concatenation_of_single_games():
+    """
+    Converting games one at a time, as iter_data_df does, gives the same frame as converting them together.
+    """
+    scraper = api_scraper.MLB_Scrape()
+    feeds = load_feeds()
+
+    together = scraper.get_data_df(feeds)
+    one_by_one = pl.concat([scraper.get_data_df([feed]) for feed in feeds], how='vertical_relaxed')
+
+    assert_frame_equal(one_by_one, together)
+
+
+def test_get_data_df_empty():
+    df = api_scraper.MLB_Scrape().get_data_df([])
+
+    assert len(df) == 0
+    assert df.schema == api_scraper.PITCH_SCHEMA
@@ -0,0 +1,121 @@
+import copy
+import json
+import os
+import time
+from polars.testing import assert_frame_equal
+import api_scraper
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def live_feed(n_plays):
+    # The first synthetic game, cut off after n_plays at-bats and still in progress
+    with open(os.path.join(DATA, 'feeds.json')) as f:
+        feed = json.load(f)[0]
+    feed['gameData']['status'] = {'abstractGameState': 'Live', 'codedGameState': 'I'}
+    feed['liveData']['plays']['allPlays'] = feed['liveData']['plays']['allPlays'][:n_plays]
+    return feed
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return copy.deepcopy(self.data)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, feeds: dict):
+        self.feeds = feeds
+        self.patches = {}
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        game_id = int(url.split('/game/')[1].split('/')[0])
+        if url.endswith('/diffPatch'):
+            return FakeResponse(self.patches[game_id])
+        return FakeResponse(self.feeds[game_id])
+
+
+def patched(feed, operations):
+    # The feed the API would serve once the patch has been made
+    feed = copy.deepcopy(feed)
+    api_scraper.MLB_Scrape()._apply_json_patch(feed, operations)
+    return feed
+
+
+def test_patch_to_a_finished_at_bat_is_parsed_again():
+    full = live_feed(12)
+    session = FakeSession({101: live_feed(10)})
+    scraper = api_scraper.MLB_Scrape(session=session)
+    scraper.get_live_data_df(101)
+
+    # A pitch in the first at-bat is reclassified while two new at-bats are added
+    operations = [{'op': 'replace', 'path': '/liveData/plays/allPlays/0/playEvents/1/details/type/code', 'value': 'KN'},
+                  {'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': full['liveData']['plays']['allPlays'][10]},
+                  {'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': full['liveData']['plays']['allPlays'][11]}]
+    session.patches[101] = [{'diff': operations}]
+    df = scraper.get_live_data_df(101)
+
+    assert session.urls[-1].endswith('/diffPatch')
+    assert df['pitch_type'][1] == 'KN'
+    assert_frame_equal(df, scraper.get_data_df([patched(live_feed(10), operations)]))
+
+
+def test_patch_to_the_teams_is_parsed_again():
+    session = FakeSession({101: live_feed(10)})
+    scraper = api_scraper.MLB_Scrape(session=session)
+    scraper.get_live_data_df(101)
+
+    operations = [{'op': 'replace', 'path': '/gameData/teams/home/abbreviation', 'value': 'BOX'}]
+    session.patches[101] = [{'diff': operations}]
+    df = scraper.get_live_data_df(101)
+
+    assert_frame_equal(df, scraper.get_data_df([patched(live_feed(10), operations)]))
+
+
+def test_final_game_is_dropped_from_the_live_state():
+    session = FakeSession({101: live_feed(10)})
+    scraper = api_scraper.MLB_Scrape(session=session)
+    scraper.get_live_data_df(101)
+    assert 101 in scraper._live_games
+
+    session.patches[101] = [{'diff': [{'op': 'replace', 'path': '/gameData/status/abstractGameState', 'value': 'Final'}]}]
+    scraper.get_live_data_df(101)
+
+    assert 101 not in scraper._live_games
+    assert 101 in scraper._final_games
+
+
+def test_live_state_is_bounded():
+    feeds = {game_id: dict(live_feed(3), gamePk=game_id) for game_id in (1, 2, 3)}
+    session = FakeSession(feeds)
+    session.patches[3] = []
+    scraper = api_scraper.MLB_Scrape(session=session)
+    scraper.max_live_games = 2
+
+    for game_id in feeds:
+        scraper.get_live_data_df(game_id)
+    assert list(scraper._live_games) == [2, 3]
+
+    # A game that has not been updated for live_ttl seconds is forgotten on the next call
+    scraper._live_games[2]['updated'] = time.time() - scraper.live_ttl - 1
+    scraper.get_live_data_df(3)
+    assert list(scraper._live_games) == [3]
+
+
+def test_get_game_df_follows_games_in_progress():
+    session = FakeSession({101: live_feed(10)})
+    scraper = api_scraper.MLB_Scrape(session=session)
+
+    first = scraper.get_game_df(101)
+    session.patches[101] = []
+    second = scraper.get_game_df(101)
+
+    assert [url.split('/')[-1] for url in session.urls] == ['live', 'diffPatch']
+    assert_frame_equal(first, second)
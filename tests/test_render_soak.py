@@ -0,0 +1,48 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib.pyplot as plt
+import pytest
+import api_scraper
+import PitchPlotFunctions as ppf
+from synthetic import many_feeds, header_assets
+
+N_RENDERS = 500
+WARMUP = 50
+PLOT_TYPES = ['short_form_movement', 'long_form_movement', 'release_point']
+
+
+def rss_mb():
+    # Resident set size of this process
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.exists('/proc/self/status'), reason='reads RSS from /proc')
+def test_rss_is_flat_over_500_renders(tmp_path):
+    """
+    500 consecutive renders, from 4 client threads through the bounded render pool, do not grow the process.
+    Each render is of a different sample of the pitches, so none of them is served from the figure cache.
+    """
+    scraper = api_scraper.MLB_Scrape()
+    ploter = ppf.PitchPlotFunctions(scraper=scraper, image_cache=ppf.ImageCache(scraper, path=str(tmp_path)),
+                                    figure_cache=ppf.FigureCache(max_bytes=0))
+    df = ploter.df_to_polars(scraper.get_data_df(many_feeds(20)), 500, '2024-01-01', '2024-12-31', ['L', 'R'])
+    assets = header_assets()
+
+    def render(i):
+        sample = df.sample(fraction=0.9, seed=i)
+        return ploter.render_png(sample, 500, PLOT_TYPES[i % len(PLOT_TYPES)], 1, assets=assets, quality='preview')
+
+    rss = {}
+    with ThreadPoolExecutor(max_workers=4) as clients:
+        for n, png in enumerate(clients.map(render, range(N_RENDERS)), start=1):
+            assert png[:4] == b'\x89PNG'
+            if n in (WARMUP, N_RENDERS):
+                rss[n] = rss_mb()
+                print(f'RSS after {n} renders: {rss[n]:.0f} MB')
+
+    assert plt.get_fignums() == []
+    assert rss[N_RENDERS] - rss[WARMUP] < 50, rss
@@ -0,0 +1,67 @@
+import gc
+import json
+import os
+import api_scraper
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+class FakeScraper(api_scraper.MLB_Scrape):
+    # Serves the two synthetic finished games instead of the MLB API
+    def __init__(self):
+        super().__init__()
+        with open(os.path.join(DATA, 'feeds.json')) as f:
+            self.feeds = {feed['gamePk']: feed for feed in json.load(f)}
+        self.downloads = []
+
+    def get_player_games_list(self, player_id, season, start_date=None, end_date=None, sport_id=1, game_type=['R']):
+        return [202, 101]
+
+    def get_game_feed(self, game_id):
+        self.downloads.append(game_id)
+        self._final_games.add(game_id)
+        return self.feeds[game_id]
+
+
+def get(cache, pitcher_id=500):
+    return cache.get(sport_id=1, pitcher_id=pitcher_id, start_date='2024-04-01', end_date='2024-04-30')
+
+
+def test_games_handed_out_over_budget_are_not_evicted():
+    scraper = FakeScraper()
+    # Every stored game is over the budget, so only the references keep them
+    store = api_scraper.SharedPitchStore(scraper, max_bytes=1)
+    first = api_scraper.PitchDataCache(scraper, shared_store=store)
+    second = api_scraper.PitchDataCache(scraper, shared_store=store)
+
+    get(first)
+    get(second)
+
+    assert sorted(scraper.downloads) == [101, 202]
+    assert store.refcounts() == {202: 2, 101: 2}
+    assert store.stats()['games'] == 2
+
+
+def test_each_cache_holds_a_game_once():
+    scraper = FakeScraper()
+    store = api_scraper.SharedPitchStore(scraper, max_bytes=1)
+    cache = api_scraper.PitchDataCache(scraper, shared_store=store)
+
+    # Both pitchers appear in both games
+    get(cache, pitcher_id=500)
+    get(cache, pitcher_id=501)
+
+    assert store.refcounts() == {202: 1, 101: 1}
+
+
+def test_games_are_evicted_once_released():
+    scraper = FakeScraper()
+    store = api_scraper.SharedPitchStore(scraper, max_bytes=1)
+    cache = api_scraper.PitchDataCache(scraper, shared_store=store)
+    get(cache)
+
+    del cache
+    gc.collect()
+
+    assert store.stats()['games'] == 0
+    assert store.stats()['evictions'] == 2
@@ -0,0 +1,98 @@
+import threading
+import time
+import requests
+import api_scraper
+
+N_CALLERS = 16
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.urls = []
+        self.scraper = None
+        self.wait_for_callers = True
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        # Hold the download until every other caller is waiting on it
+        deadline = time.monotonic() + 5
+        while self.wait_for_callers and self.scraper._flight.shared < N_CALLERS - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        if self.error is not None:
+            raise self.error
+        return FakeResponse({'gamePk': 1, 'gameData': {'status': {'abstractGameState': 'Final'}}})
+
+
+def call_in_parallel(scraper):
+    barrier = threading.Barrier(N_CALLERS)
+    results = [None] * N_CALLERS
+    errors = [None] * N_CALLERS
+
+    def call(i):
+        barrier.wait()
+        try:
+            results[i] = scraper.get_game_feed(1)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(N_CALLERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def make_scraper(session):
+    scraper = api_scraper.MLB_Scrape(session=session)
+    session.scraper = scraper
+    return scraper
+
+
+def test_parallel_callers_share_one_download():
+    session = FakeSession()
+    scraper = make_scraper(session)
+
+    results, errors = call_in_parallel(scraper)
+
+    assert len(session.urls) == 1
+    assert errors == [None] * N_CALLERS
+    assert all(result is results[0] for result in results)
+    assert scraper._flight.calls == 1
+    assert scraper._flight.shared == N_CALLERS - 1
+
+
+def test_parallel_callers_share_one_failure():
+    error = requests.HTTPError('503 Server Error')
+    session = FakeSession(error=error)
+    scraper = make_scraper(session)
+
+    results, errors = call_in_parallel(scraper)
+
+    assert len(session.urls) == 1
+    assert results == [None] * N_CALLERS
+    assert all(e is error for e in errors)
+
+
+def test_later_call_downloads_again():
+    session = FakeSession()
+    scraper = make_scraper(session)
+
+    call_in_parallel(scraper)
+    # A finished call is not cached by the single flight itself
+    session.wait_for_callers = False
+    scraper.get_game_feed(1)
+
+    assert len(session.urls) == 2
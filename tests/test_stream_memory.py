@@ -0,0 +1,61 @@
+import json
+import tracemalloc
+import api_scraper
+from synthetic import load_feeds
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, game_id: int):
+        self.body = body
+        self.game_id = game_id
+
+    def json(self):
+        # Decode a new dict on every call, as a download would
+        data = json.loads(self.body)
+        data['gamePk'] = self.game_id
+        return data
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self.bodies = [json.dumps(feed).encode() for feed in load_feeds()]
+
+    def get(self, url, **kwargs):
+        game_id = int(url.split('/game/')[1].split('/')[0])
+        return FakeResponse(self.bodies[game_id % len(self.bodies)], game_id)
+
+
+def peak_bytes(fetch, n_games):
+    scraper = api_scraper.MLB_Scrape(session=FakeSession())
+    tracemalloc.start()
+    try:
+        fetch(scraper, list(range(n_games)))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def stream(scraper, game_list):
+    # Consume the games one at a time, dropping each frame like backfill.py does
+    for data_df in scraper.iter_data_df(game_list, max_workers=4):
+        pass
+
+
+def hold_all(scraper, game_list):
+    scraper.get_data_df(scraper.get_data(game_list, max_workers=4))
+
+
+def test_iter_data_df_peak_memory_does_not_grow_with_games():
+    """
+    Peak Python memory of iter_data_df is bounded by the feeds in flight, not by the number of games requested.
+    Fetching every feed before converting them, as get_data does, grows with the games instead.
+    """
+    few = peak_bytes(stream, 20)
+    many = peak_bytes(stream, 200)
+    held = peak_bytes(hold_all, 200)
+
+    assert many < 1.5 * few, (few, many)
+    assert held > 5 * many, (many, held)